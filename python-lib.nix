@@ -15,6 +15,11 @@
   markitdown,
   beautifulsoup4,
   requests,
+  orjson,
+  xxhash,
+  aiohttp,
+  uvloop,
+  httptools,
 }:
 
 buildPythonPackage {
@@ -48,6 +53,11 @@ buildPythonPackage {
     markitdown
     beautifulsoup4
     requests
+    orjson
+    xxhash
+    aiohttp
+    uvloop
+    httptools
   ];
 
   # this package has no tests
@@ -0,0 +1,25 @@
+"""Tests for the SPA content stability monitor."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from text_extraction.spa_extraction import _content_digest, monitor_content_stability
+
+
+class _StaticPage:
+    """Minimal page stand-in whose HTML never changes."""
+    
+    async def content(self) -> str:
+        return "<html><body><main>Stable lesson text – äöü</main></body></html>"
+
+
+def test_content_digest_accepts_str():
+    html = "<p>Grüße</p>"
+    assert _content_digest(html) == _content_digest(html)
+
+
+def test_monitor_content_stability_detects_static_page():
+    assert asyncio.run(monitor_content_stability(_StaticPage(), max_wait=5)) is True
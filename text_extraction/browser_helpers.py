@@ -8,10 +8,10 @@ Refactored for better maintainability with modular architecture.
 
 import asyncio
 import logging
+import os
 import random
 import sys
 import time
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -27,8 +27,9 @@ if sys.platform.startswith('win'):
         pass
 
 # Import specialized modules
-from .spa_extraction import enhanced_spa_extraction
+from .spa_extraction import SPA_HELPERS_JS, enhanced_spa_extraction
 from .error_detection import fallback_extraction_strategies
+from .timestamps import iso_now_cached
 
 try:
     from .markitdown_converter import (
@@ -50,6 +51,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Run Chromium in a single OS process (for constrained containers only)
+PLAYWRIGHT_SINGLE_PROCESS = os.getenv("PLAYWRIGHT_SINGLE_PROCESS", "0") == "1"
+
 
 def _detect_language(text: str) -> str:
     """Detect language of text using py3langid."""
@@ -129,7 +133,7 @@ async def wait_for_spa_stability(page: async_api.Page, network_idle_timeout=3000
     """
     try:
         # 1. Auf Netzwerkruhe warten
-        logger.debug(f"Waiting for network idle (timeout: {network_idle_timeout}ms)")
+        logger.debug("Waiting for network idle (timeout: %sms)", network_idle_timeout)
         await page.wait_for_load_state('networkidle', timeout=network_idle_timeout)
         
         # 2. MutationObserver im Seitenkontext einrichten
@@ -153,7 +157,7 @@ async def wait_for_spa_stability(page: async_api.Page, network_idle_timeout=3000
 
         # 3. Auf eine Periode ohne Änderungen warten
         remaining_timeout = max_total_timeout - network_idle_timeout
-        logger.debug(f"Waiting for DOM stability ({stable_time}ms without mutations, timeout: {remaining_timeout}ms)")
+        logger.debug("Waiting for DOM stability (%sms without mutations, timeout: %sms)", stable_time, remaining_timeout)
         await page.wait_for_function(
             f"() => performance.now() - window.__lastMutation > {stable_time}",
             timeout=remaining_timeout
@@ -162,7 +166,7 @@ async def wait_for_spa_stability(page: async_api.Page, network_idle_timeout=3000
         logger.debug("DOM stability achieved")
         
     except Exception as e:
-        logger.warning(f"SPA stability wait failed: {e}")
+        logger.warning("SPA stability wait failed: %s", e)
     finally:
         # 4. Observer aufräumen (immer ausführen, auch bei Fehlern)
         try:
@@ -177,7 +181,7 @@ async def wait_for_spa_stability(page: async_api.Page, network_idle_timeout=3000
             """)
             logger.debug("Mutation observer cleaned up")
         except Exception as cleanup_error:
-            logger.warning(f"Observer cleanup failed: {cleanup_error}")
+            logger.warning("Observer cleanup failed: %s", cleanup_error)
 
 
 async def _extract_page_content(page: async_api.Page) -> str:
@@ -212,6 +216,88 @@ async def _extract_page_content(page: async_api.Page) -> str:
     return ""
 
 
+async def launch_browser(playwright: async_api.Playwright) -> async_api.Browser:
+    """
+    Launch Chromium with the enhanced stability configuration.
+    
+    Falls back to a minimal argument set if the primary configuration
+    cannot be launched on this platform. Set ``PLAYWRIGHT_SINGLE_PROCESS=1``
+    to run Chromium as a single process (Docker with tight cgroups); by
+    default renderers get their own processes and can use multiple cores.
+    
+    Args:
+        playwright: Started Playwright instance
+        
+    Returns:
+        async_api.Browser: Launched browser
+    """
+    # Enhanced browser launch configuration for stability
+    primary_args = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-web-security',
+        # Chromium only honours the last --disable-features flag, so list all features once
+        '--disable-features=VizDisplayCompositor,TranslateUI,BlinkGenPropertyTrees',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-extensions',
+        '--disable-plugins',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--disable-translate',
+        '--hide-scrollbars',
+        '--mute-audio',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-logging',
+        '--disable-permissions-api',
+        '--disable-presentation-api',
+        '--disable-speech-api',
+        '--disable-file-system',
+        '--disable-sensors',
+        '--disable-geolocation',
+        '--disable-notifications',
+        '--disable-hang-monitor',
+        '--disable-prompt-on-repost',
+        '--disable-domain-reliability',
+    ]
+    if PLAYWRIGHT_SINGLE_PROCESS:
+        primary_args.append('--single-process')
+
+    if sys.platform.startswith('win'):
+        primary_args = [
+            '--disable-gpu',
+            '--disable-extensions',
+            '--disable-background-timer-throttling',
+            '--mute-audio',
+            '--disable-notifications',
+        ]
+
+    launch_options: Dict[str, Any] = {
+        'headless': True,
+        'args': primary_args,
+        'timeout': 60000,
+    }
+
+    if not sys.platform.startswith('win'):
+        launch_options['slow_mo'] = 50
+
+    try:
+        return await playwright.chromium.launch(**launch_options)
+    except Exception as launch_error:
+        logger.warning("Primary Chromium launch configuration failed: %s", launch_error)
+        fallback_args = ['--disable-gpu']
+        if not sys.platform.startswith('win'):
+            fallback_args.insert(0, '--no-sandbox')
+
+        launch_options.pop('slow_mo', None)
+        launch_options['args'] = fallback_args
+
+        return await playwright.chromium.launch(**launch_options)
+
+
 async def extract_with_browser(
     url: str,
     browser: Optional[async_api.Browser] = None,
@@ -230,14 +316,14 @@ async def extract_with_browser(
     Extract text from URL using browser automation with Playwright.
     
     This function provides robust browser-based extraction with multiple
-    fallback strategies for JavaScript-heavy sites and SPAs. Uses fresh
-    browser instances for maximum stability.
+    fallback strategies for JavaScript-heavy sites and SPAs. Each request
+    runs in its own browser context on the given (shared) browser.
     
     Args:
         browser: Optional browser instance (if None, creates fresh instance)
     """
-    logger.error(f"DEBUG: extract_with_browser called with output_format='{output_format}'")
-    logger.info(f"Starting robust browser extraction for URL: {url}")
+    logger.error("DEBUG: extract_with_browser called with output_format='%s'", output_format)
+    logger.info("Starting robust browser extraction for URL: %s", url)
     
     # Prepare MarkItDown converter for file downloads when requested
     converter = None
@@ -249,7 +335,7 @@ async def extract_with_browser(
                     timeout_seconds=conversion_timeout,
                 )
             except Exception as converter_error:  # pragma: no cover - defensive
-                logger.warning(f"Could not initialize MarkItDown converter: {converter_error}")
+                logger.warning("Could not initialize MarkItDown converter: %s", converter_error)
                 converter = None
         else:
             logger.info("MarkItDown converter not available in browser mode")
@@ -262,73 +348,11 @@ async def extract_with_browser(
             from playwright.async_api import async_playwright
             fresh_playwright = await async_playwright().start()
 
-            # Enhanced browser launch configuration for stability
-            primary_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-default-apps',
-                '--disable-sync',
-                '--disable-translate',
-                '--hide-scrollbars',
-                '--mute-audio',
-                '--no-first-run',
-                '--no-default-browser-check',
-                '--disable-logging',
-                '--disable-permissions-api',
-                '--disable-presentation-api',
-                '--disable-speech-api',
-                '--disable-file-system',
-                '--disable-sensors',
-                '--disable-geolocation',
-                '--disable-notifications',
-                '--disable-features=TranslateUI',
-                '--disable-hang-monitor',
-                '--disable-prompt-on-repost',
-                '--disable-domain-reliability',
-            ]
-
-            if sys.platform.startswith('win'):
-                primary_args = [
-                    '--disable-gpu',
-                    '--disable-extensions',
-                    '--disable-background-timer-throttling',
-                    '--mute-audio',
-                    '--disable-notifications',
-                ]
-
-            launch_options: Dict[str, Any] = {
-                'headless': True,
-                'args': primary_args,
-                'timeout': 60000,
-            }
-
-            if not sys.platform.startswith('win'):
-                launch_options['slow_mo'] = 50
-
-            try:
-                fresh_browser = await fresh_playwright.chromium.launch(**launch_options)
-            except Exception as launch_error:
-                logger.warning(f"Primary Chromium launch configuration failed: {launch_error}")
-                fallback_args = ['--disable-gpu']
-                if not sys.platform.startswith('win'):
-                    fallback_args.insert(0, '--no-sandbox')
-
-                launch_options.pop('slow_mo', None)
-                launch_options['args'] = fallback_args
-
-                fresh_browser = await fresh_playwright.chromium.launch(**launch_options)
+            fresh_browser = await launch_browser(fresh_playwright)
             browser = fresh_browser
             logger.debug("Created fresh browser instance with enhanced stability configuration")
         except Exception as e:
-            logger.error(f"Failed to create fresh browser instance: {e}")
+            logger.error("Failed to create fresh browser instance: %s", e)
             return {
                 "text": "",
                 "status": 500,
@@ -347,7 +371,7 @@ async def extract_with_browser(
     proxy_list = list(proxies) if proxies else [None]
     if proxies:
         random.shuffle(proxy_list)  # Random proxy selection
-        logger.info(f"Using random proxy selection from {len(proxy_list)} available proxies")
+        logger.info("Using random proxy selection from %s available proxies", len(proxy_list))
     else:
         proxy_list = [None]  # None means direct connection
         logger.info("No proxies provided, using direct connection")
@@ -366,21 +390,17 @@ async def extract_with_browser(
             # Create browser context with or without proxy
             if proxy:
                 proxy_used = proxy
-                logger.info(f"Attempting browser request with proxy: {proxy}")
+                logger.info("Attempting browser request with proxy: %s", proxy)
                 try:
                     # Create context with proxy configuration
                     context = await browser.new_context(
                         proxy={"server": f"http://{proxy}"},
                         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
                     )
+                    await context.add_init_script(SPA_HELPERS_JS)
                     page = await context.new_page()
                 except Exception as proxy_error:
-                    logger.error(f"Error creating browser context with proxy {proxy}: {proxy_error}")
-                    if context:
-                        try:
-                            await context.close()
-                        except Exception:
-                            pass
+                    logger.error("Error creating browser context with proxy %s: %s", proxy, proxy_error)
                     continue
             else:
                 proxy_used = None
@@ -390,14 +410,10 @@ async def extract_with_browser(
                     context = await browser.new_context(
                         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
                     )
+                    await context.add_init_script(SPA_HELPERS_JS)
                     page = await context.new_page()
                 except Exception as direct_error:
-                    logger.error(f"Error creating browser context without proxy: {direct_error}")
-                    if context:
-                        try:
-                            await context.close()
-                        except Exception:
-                            pass
+                    logger.error("Error creating browser context without proxy: %s", direct_error)
                     continue
             
             # Enhanced browser configuration for better JS/SPA support
@@ -417,12 +433,12 @@ async def extract_with_browser(
                 await page.set_viewport_size({"width": 1920, "height": 1080})
                 
             except Exception as config_error:
-                logger.warning(f"Could not set browser configuration: {config_error}")
+                logger.warning("Could not set browser configuration: %s", config_error)
             
             # Navigate to the page with enhanced error handling
             navigation_successful = False
             try:
-                logger.debug(f"Navigating to {url} with browser (timeout: {timeout}s)")
+                logger.debug("Navigating to %s with browser (timeout: %ss)", url, timeout)
                 response = await page.goto(
                     url,
                     wait_until="domcontentloaded",
@@ -489,9 +505,6 @@ async def extract_with_browser(
                                         "quality_metrics": None,
                                     }
 
-                                    if context:
-                                        await context.close()
-
                                     logger.info(
                                         "Successfully converted file in browser mode (%d chars)",
                                         len(converted_text),
@@ -499,19 +512,19 @@ async def extract_with_browser(
                                     return result
                         except MarkItDownConversionError as conversion_error:
                             logger.warning(
-                                f"File conversion failed in browser mode for {final_url}: {conversion_error}"
+                                "File conversion failed in browser mode for %s: %s", final_url, conversion_error
                             )
                         except Exception as conversion_error:  # pragma: no cover - defensive
                             logger.error(
-                                f"Unexpected error during file conversion for {final_url}: {conversion_error}"
+                                "Unexpected error during file conversion for %s: %s", final_url, conversion_error
                             )
                         # Continue with normal extraction when conversion fails
 
                     navigation_successful = True
-                    logger.debug(f"Navigation successful: {status_code} - {final_url}")
+                    logger.debug("Navigation successful: %s - %s", status_code, final_url)
                 
             except Exception as goto_error:
-                logger.warning(f"Navigation error for {url}: {goto_error}")
+                logger.warning("Navigation error for %s: %s", url, goto_error)
                 # Try alternative navigation approach
                 try:
                     logger.debug("Trying alternative navigation with networkidle")
@@ -524,9 +537,9 @@ async def extract_with_browser(
                         status_code = response.status
                         final_url = response.url
                         navigation_successful = True
-                        logger.debug(f"Alternative navigation successful: {status_code}")
+                        logger.debug("Alternative navigation successful: %s", status_code)
                 except Exception as alt_error:
-                    logger.warning(f"Alternative navigation also failed: {alt_error}")
+                    logger.warning("Alternative navigation also failed: %s", alt_error)
                     # Continue anyway - page might be partially loaded
     
             # Enhanced waiting strategy for JS/SPA content with advanced detection
@@ -541,57 +554,49 @@ async def extract_with_browser(
                         
                         # Check if it's an error page but still has content
                         if extraction_result.get('is_error_page'):
-                            logger.info(f"Error page detected and processed: {extraction_result.get('error_type', 'unknown')}")
+                            logger.info("Error page detected and processed: %s", extraction_result.get('error_type', 'unknown'))
                         else:
-                            logger.info(f"Enhanced SPA extraction successful: {len(content)} chars")
+                            logger.info("Enhanced SPA extraction successful: %s chars", len(content))
                     else:
                         # Fallback to original strategies with improvements
                         content, extraction_method = await fallback_extraction_strategies(page)
                         
                 except Exception as spa_error:
-                    logger.warning(f"Enhanced SPA extraction failed: {spa_error}")
+                    logger.warning("Enhanced SPA extraction failed: %s", spa_error)
                     # Fallback to basic extraction
                     content, extraction_method = await fallback_extraction_strategies(page)
             
             if content:
-                logger.info(f"Browser extraction successful via {extraction_method}: {len(content)} chars")
-                # Close context and break out of proxy loop on success
-                if context:
-                    try:
-                        await context.close()
-                        logger.debug("Browser context closed successfully")
-                    except Exception as close_error:
-                        logger.warning(f"Error closing browser context: {close_error}")
+                logger.info("Browser extraction successful via %s: %s chars", extraction_method, len(content))
+                # Break out of proxy loop on success
                 break
             else:
-                logger.warning(f"Browser extraction failed - no content retrieved")
-                if context:
-                    try:
-                        await context.close()
-                        logger.debug("Browser context closed after failure")
-                    except Exception as close_error:
-                        logger.warning(f"Error closing browser context after failure: {close_error}")
+                logger.warning("Browser extraction failed - no content retrieved")
                 if proxy:
                     continue  # Try next proxy
                 else:
                     break  # No more options
             
         except Exception as page_error:
-            logger.error(f"Error creating/using page with proxy {proxy}: {page_error}")
-            if context:
-                try:
-                    await context.close()
-                    logger.debug("Browser context closed after page error")
-                except Exception as close_error:
-                    logger.warning(f"Error closing browser context after page error: {close_error}")
+            logger.error("Error creating/using page with proxy %s: %s", proxy, page_error)
             if proxy:
                 continue  # Try next proxy
             else:
                 break  # No more options
+        finally:
+            # Release the context on every exit path, including cancellation
+            # by the request deadline, so it cannot outlive the request on
+            # the shared browser
+            if context:
+                try:
+                    await context.close()
+                    logger.debug("Browser context closed")
+                except Exception as close_error:
+                    logger.warning("Error closing browser context: %s", close_error)
     
     # If we reach here and have no content, return error
     if not content:
-        logger.error(f"All browser extraction attempts failed for {url}")
+        logger.error("All browser extraction attempts failed for %s", url)
         
         # Cleanup fresh browser instances on failure
         if fresh_browser:
@@ -621,7 +626,7 @@ async def extract_with_browser(
         }
     
     # Process extracted content
-    logger.error(f"DEBUG: Starting content processing with output_format='{output_format}', content length={len(content)}")
+    logger.error("DEBUG: Starting content processing with output_format='%s', content length=%s", output_format, len(content))
     try:
         # Use trafilatura to extract clean text from HTML
         import trafilatura
@@ -634,7 +639,7 @@ async def extract_with_browser(
         }
         trafilatura_format = trafilatura_format_map.get(output_format, "txt")
         
-        logger.error(f"DEBUG: Output format mapping: {output_format} -> {trafilatura_format}")
+        logger.error("DEBUG: Output format mapping: %s -> %s", output_format, trafilatura_format)
         
         try:
             extracted_text = trafilatura.extract(
@@ -645,7 +650,7 @@ async def extract_with_browser(
                 include_tables=True
             )
         except Exception as e:
-            logger.error(f"DEBUG: trafilatura.extract failed with format '{trafilatura_format}': {e}")
+            logger.error("DEBUG: trafilatura.extract failed with format '%s': %s", trafilatura_format, e)
             # Try without output_format parameter
             try:
                 extracted_text = trafilatura.extract(
@@ -654,9 +659,9 @@ async def extract_with_browser(
                     include_comments=False,
                     include_tables=True
                 )
-                logger.error(f"DEBUG: trafilatura.extract succeeded without output_format")
+                logger.error("DEBUG: trafilatura.extract succeeded without output_format")
             except Exception as e2:
-                logger.error(f"DEBUG: trafilatura.extract failed even without output_format: {e2}")
+                logger.error("DEBUG: trafilatura.extract failed even without output_format: %s", e2)
                 extracted_text = None
         
         if not extracted_text:
@@ -672,7 +677,7 @@ async def extract_with_browser(
                 from .link_extraction import extract_and_classify_links
                 links = extract_and_classify_links(content, final_url)
             except Exception as e:
-                logger.warning(f"Link extraction failed: {e}")
+                logger.warning("Link extraction failed: %s", e)
                 links = []
         
         # Calculate quality metrics if requested
@@ -683,7 +688,7 @@ async def extract_with_browser(
 
                 quality_metrics = _calculate_quality(extracted_text)
             except Exception as e:
-                logger.warning(f"Quality calculation failed: {e}")
+                logger.warning("Quality calculation failed: %s", e)
         
         # Detect language
         detected_language = _detect_language(extracted_text or "")
@@ -700,7 +705,7 @@ async def extract_with_browser(
             status_message = f"HTTP {status_code} - Text extracted successfully ({text_length} characters)"
         
         # Generate timestamp and origin information
-        extraction_timestamp = datetime.now(timezone.utc).isoformat()
+        extraction_timestamp = iso_now_cached()
         extraction_origin = "realtime_crawl"  # This is a live extraction
         
         result = {
@@ -721,7 +726,7 @@ async def extract_with_browser(
             "extraction_origin": extraction_origin
         }
         
-        logger.info(f"Browser extraction completed successfully: {len(extracted_text or '')} characters")
+        logger.info("Browser extraction completed successfully: %s characters", len(extracted_text or ''))
         
         # Cleanup fresh browser instances
         if fresh_browser:
@@ -729,19 +734,19 @@ async def extract_with_browser(
                 await fresh_browser.close()
                 logger.debug("Fresh browser instance closed")
             except Exception as cleanup_error:
-                logger.warning(f"Error closing fresh browser: {cleanup_error}")
+                logger.warning("Error closing fresh browser: %s", cleanup_error)
         
         if fresh_playwright:
             try:
                 await fresh_playwright.stop()
                 logger.debug("Fresh playwright instance stopped")
             except Exception as cleanup_error:
-                logger.warning(f"Error stopping fresh playwright: {cleanup_error}")
+                logger.warning("Error stopping fresh playwright: %s", cleanup_error)
         
         return result
         
     except Exception as e:
-        logger.error(f"Content processing failed for {url}: {e}")
+        logger.error("Content processing failed for %s: %s", url, e)
         
         # Cleanup fresh browser instances on error
         if fresh_browser:
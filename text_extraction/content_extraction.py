@@ -13,7 +13,9 @@ import gzip
 import logging
 import random
 import time
-from datetime import datetime, timezone
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,6 +24,8 @@ import requests
 import trafilatura
 from trafilatura.settings import use_config
 
+from .timestamps import iso_now_cached
+
 logger = logging.getLogger(__name__)
 
 # Import MarkItDown converter and other modules
@@ -65,16 +69,16 @@ async def retry_with_backoff(
             
             # Check if this is a retryable error
             if not is_retryable_error(e):
-                logger.warning(f"Non-retryable error on attempt {attempt + 1}: {e}")
+                logger.warning("Non-retryable error on attempt %s: %s", attempt + 1, e)
                 raise e
             
             if attempt == max_retries:
-                logger.error(f"Max retries ({max_retries}) exceeded. Last error: {e}")
+                logger.error("Max retries (%s) exceeded. Last error: %s", max_retries, e)
                 raise e
             
             # Calculate delay with exponential backoff
             delay = min(base_delay * (backoff_factor ** attempt), max_delay)
-            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.1f}s...")
+            logger.warning("Attempt %s failed: %s. Retrying in %.1fs...", attempt + 1, e, delay)
             await asyncio.sleep(delay)
     
     # This should never be reached, but just in case
@@ -101,6 +105,43 @@ def is_retryable_error(error: Exception) -> bool:
     return any(pattern in error_str for pattern in retryable_patterns)
 
 
+def is_not_modified(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    timeout: int = 10
+) -> bool:
+    """
+    Revalidate a previously fetched URL with a conditional GET.
+    
+    Args:
+        url: URL to revalidate
+        etag: ETag of the cached response, sent as If-None-Match
+        last_modified: Last-Modified of the cached response, sent as If-Modified-Since
+        timeout: Request timeout in seconds
+        
+    Returns:
+        bool: True if the server answered 304 Not Modified
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    if len(headers) == 1:
+        return False
+    
+    try:
+        # Stream so a 200 answer does not download the body only to discard it
+        with requests.get(url, timeout=timeout, allow_redirects=True, headers=headers, stream=True) as response:
+            return response.status_code == 304
+    except Exception as e:
+        logger.debug("Revalidation failed for %s: %s", url, e)
+        return False
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube video URL."""
     youtube_domains = [
@@ -158,7 +199,7 @@ async def convert_youtube_content(
         return text, conversion_meta
         
     except Exception as e:
-        logger.error(f"YouTube transcription failed: {e}")
+        logger.error("YouTube transcription failed: %s", e)
         return "", {
             'converted': False,
             'original_format': 'YouTube Video',
@@ -199,7 +240,7 @@ def decompress_if_needed(content: bytes) -> str:
         # Last resort: decode with errors='replace'
         return content.decode('utf-8', errors='replace')
     except Exception as e:
-        logger.warning(f"Failed to decompress/decode content: {e}")
+        logger.warning("Failed to decompress/decode content: %s", e)
         return content.decode('utf-8', errors='replace')
 
 
@@ -233,7 +274,7 @@ def extract_text_from_html(
         
         return text or ""
     except Exception as e:
-        logger.error(f"Text extraction failed: {e}")
+        logger.error("Text extraction failed: %s", e)
         return ""
 
 
@@ -248,7 +289,7 @@ def extract_links_from_html(html_content: str, base_url: str) -> List[Dict[str,
             logger.warning("Link extraction module not available")
             return []
     except Exception as e:
-        logger.error(f"Link extraction failed: {e}")
+        logger.error("Link extraction failed: %s", e)
         return []
 
 
@@ -262,7 +303,7 @@ def calculate_quality_metrics(text: str) -> Optional[Dict[str, Any]]:
         logger.warning("Quality metrics module not available")
         return None
     except Exception as e:
-        logger.error(f"Quality metrics calculation failed: {e}")
+        logger.error("Quality metrics calculation failed: %s", e)
         return None
 
 
@@ -309,16 +350,67 @@ async def convert_file_content(
             return text, metadata
 
         except ImportError as e:
-            logger.warning(f"MarkItDown converter module not available: {e}")
+            logger.warning("MarkItDown converter module not available: %s", e)
             return "", {"converted": False, "reason": "converter_not_available"}
         except MarkItDownConversionError as conversion_error:
-            logger.warning(f"MarkItDown conversion failed: {conversion_error}")
+            logger.warning("MarkItDown conversion failed: %s", conversion_error)
             return "", {"converted": False, "reason": str(conversion_error)}
     except Exception as e:
-        logger.error(f"File conversion failed: {e}")
+        logger.error("File conversion failed: %s", e)
         return "", {"converted": False, "reason": f"conversion_error: {str(e)}"}
 
 
+def process_html_content(
+    html_content: bytes,
+    final_url: str,
+    output_format: str = "markdown",
+    target_language: str = "auto",
+    preference: str = "none",
+    include_links: bool = False,
+    calculate_quality: bool = False
+) -> Tuple[str, str, List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Parse fetched HTML into text, language, links and quality metrics.
+    
+    This is the CPU-bound part of ``extract_from_url``. It only takes and
+    returns picklable values so it can run in a process pool.
+    
+    Returns:
+        Tuple of (extracted_text, detected_lang, links, quality_metrics)
+    """
+    # Process HTML content
+    if is_binary_content(html_content):
+        html_text = decompress_if_needed(html_content)
+    else:
+        html_text = html_content.decode('utf-8', errors='replace')
+    
+    # Extract text using trafilatura
+    extracted_text = extract_text_from_html(
+        html_content=html_text,
+        output_format=output_format,
+        target_language=target_language,
+        preference=preference
+    )
+    
+    if not extracted_text:
+        raise ValueError("No text content could be extracted")
+    
+    # Detect language
+    detected_lang = get_lang(extracted_text) if target_language == "auto" else target_language
+    
+    # Extract links if requested
+    extracted_links = []
+    if include_links:
+        extracted_links = extract_links_from_html(html_text, final_url)
+    
+    # Calculate quality metrics if requested
+    quality_metrics = None
+    if calculate_quality:
+        quality_metrics = calculate_quality_metrics(extracted_text)
+    
+    return extracted_text, detected_lang, extracted_links, quality_metrics
+
+
 async def extract_from_url(
     url: str,
     output_format: str = "markdown",
@@ -330,26 +422,31 @@ async def extract_from_url(
     include_links: bool = False,
     proxies: Optional[List[str]] = None,
     timeout: int = 30,
-    calculate_quality: bool = False
+    calculate_quality: bool = False,
+    executor: Optional[Executor] = None
 ) -> Dict[str, Any]:
     """
     Enhanced text extraction from URL with comprehensive feature support.
     
     This function provides the core extraction logic for the enhanced API,
     including file conversion, proxy rotation, link extraction, and quality metrics.
+    
+    Args:
+        executor: Optional (process pool) executor for the CPU-bound HTML parsing,
+            keeping trafilatura off the event loop thread
     """
     start_time = time.time()
     
     try:
-        logger.info(f"extract_from_url called with: url={url}, convert_files={convert_files}")
+        logger.info("extract_from_url called with: url=%s, convert_files=%s", url, convert_files)
         
         # Check for YouTube URLs first (MarkItDown can transcribe these)
         is_youtube = is_youtube_url(url)
-        logger.info(f"YouTube URL check: {is_youtube} for {url}")
+        logger.info("YouTube URL check: %s for %s", is_youtube, url)
         
         if convert_files and is_youtube:
             try:
-                logger.info(f"Entering YouTube transcription branch for: {url}")
+                logger.info("Entering YouTube transcription branch for: %s", url)
                 converted_text, conversion_meta = await convert_youtube_content(
                     url=url,
                     output_format=output_format,
@@ -376,15 +473,17 @@ async def extract_from_url(
                         **conversion_meta
                     }
                 else:
-                    logger.warning(f"YouTube transcription failed, falling back to regular extraction: {url}")
+                    logger.warning("YouTube transcription failed, falling back to regular extraction: %s", url)
             except Exception as e:
-                logger.warning(f"YouTube transcription error: {e}, falling back to regular extraction")
+                logger.warning("YouTube transcription error: %s, falling back to regular extraction", e)
         
         # Check for unsupported file formats
         if convert_files:
             # Try file conversion if enabled
             try:
-                response = requests.head(url, timeout=10, allow_redirects=True)
+                # requests is blocking, so every fetch runs in a worker thread
+                # to keep the event loop (and the request deadline) responsive
+                response = await asyncio.to_thread(requests.head, url, timeout=10, allow_redirects=True)
                 content_type = response.headers.get('content-type', '').lower()
                 
                 # Check if it's a convertible file format (comprehensive MIME type detection)
@@ -413,7 +512,7 @@ async def extract_from_url(
                 
                 if any(mime_type in content_type for mime_type in office_mime_types):
                     # Download and convert file
-                    response = requests.get(url, timeout=timeout, allow_redirects=True)
+                    response = await asyncio.to_thread(requests.get, url, timeout=timeout, allow_redirects=True)
                     response.raise_for_status()
                     
                     converted_text, conversion_meta = await convert_file_content(
@@ -446,7 +545,7 @@ async def extract_from_url(
                         
                         return result
             except Exception as e:
-                logger.warning(f"File conversion failed, falling back to HTML extraction: {e}")
+                logger.warning("File conversion failed, falling back to HTML extraction: %s", e)
         
         # Standard HTML extraction with proxy support
         # Initialize variables
@@ -454,6 +553,7 @@ async def extract_from_url(
         final_url = url
         proxy_used = None
         http_status = 200  # Default status
+        response_headers = {}
         
         # Try with proxies if provided
         if proxies:
@@ -463,13 +563,14 @@ async def extract_from_url(
             
             for proxy in proxy_list:
                 try:
-                    logger.info(f"Trying proxy: {proxy}")
+                    logger.info("Trying proxy: %s", proxy)
                     proxies_dict = {
                         'http': f'http://{proxy}',
                         'https': f'http://{proxy}'
                     }
                     
-                    response = requests.get(
+                    response = await asyncio.to_thread(
+                        requests.get,
                         url,
                         proxies=proxies_dict,
                         timeout=timeout,
@@ -485,22 +586,24 @@ async def extract_from_url(
                         # Success with proxy (even if 404/4xx, we have content)
                         html_content = response.content
                         final_url = response.url
+                        response_headers = response.headers
                         proxy_used = proxy
-                        logger.info(f"Successfully extracted using proxy: {proxy} (HTTP {http_status})")
+                        logger.info("Successfully extracted using proxy: %s (HTTP %s)", proxy, http_status)
                         break
                     else:
                         # No content, treat as failure
                         response.raise_for_status()
                     
                 except Exception as e:
-                    logger.warning(f"Proxy {proxy} failed: {e}")
+                    logger.warning("Proxy %s failed: %s", proxy, e)
                     continue
         
         # Fallback to direct connection if no proxy worked
         if html_content is None:
             try:
                 logger.info("Trying direct connection (no proxy)")
-                response = requests.get(
+                response = await asyncio.to_thread(
+                    requests.get,
                     url,
                     timeout=timeout,
                     allow_redirects=True,
@@ -514,43 +617,36 @@ async def extract_from_url(
                 if response.content and len(response.content) > 0:
                     html_content = response.content
                     final_url = response.url
-                    logger.info(f"Successfully extracted using direct connection (HTTP {http_status})")
+                    response_headers = response.headers
+                    logger.info("Successfully extracted using direct connection (HTTP %s)", http_status)
                 else:
                     # No content, treat as failure
                     response.raise_for_status()
             except Exception as e:
-                logger.error(f"Direct connection failed: {e}")
+                logger.error("Direct connection failed: %s", e)
                 raise
         
-        # Process HTML content
-        if is_binary_content(html_content):
-            html_text = decompress_if_needed(html_content)
-        else:
-            html_text = html_content.decode('utf-8', errors='replace')
-        
-        # Extract text using trafilatura
-        extracted_text = extract_text_from_html(
-            html_content=html_text,
+        # Parse the fetched HTML (CPU-bound; runs in the executor when one is given)
+        parse = partial(
+            process_html_content,
+            html_content,
+            final_url,
             output_format=output_format,
             target_language=target_language,
-            preference=preference
+            preference=preference,
+            include_links=include_links,
+            calculate_quality=calculate_quality
         )
-        
-        if not extracted_text:
-            raise ValueError("No text content could be extracted")
-        
-        # Detect language
-        detected_lang = get_lang(extracted_text) if target_language == "auto" else target_language
-        
-        # Extract links if requested
-        extracted_links = []
-        if include_links:
-            extracted_links = extract_links_from_html(html_text, final_url)
-        
-        # Calculate quality metrics if requested
-        quality_metrics = None
-        if calculate_quality:
-            quality_metrics = calculate_quality_metrics(extracted_text)
+        if executor is not None:
+            try:
+                parsed = await asyncio.get_running_loop().run_in_executor(executor, parse)
+            except BrokenProcessPool as e:
+                # A parse worker died mid-task; parse this page in a thread instead
+                logger.warning("Parse worker pool broken, parsing in thread: %s", e)
+                parsed = await asyncio.to_thread(parse)
+        else:
+            parsed = parse()
+        extracted_text, detected_lang, extracted_links, quality_metrics = parsed
         
         # Determine appropriate message based on HTTP status and content quality
         if http_status == 404:
@@ -563,7 +659,7 @@ async def extract_from_url(
             status_message = f"HTTP {http_status} - Text extracted successfully ({len(extracted_text)} characters)"
         
         # Generate timestamp and origin information
-        extraction_timestamp = datetime.now(timezone.utc).isoformat()
+        extraction_timestamp = iso_now_cached()
         extraction_origin = "realtime_crawl"  # This is a live extraction
         
         # Build result
@@ -582,13 +678,16 @@ async def extract_from_url(
             "links": extracted_links if include_links else None,
             "quality_metrics": quality_metrics,
             "extraction_timestamp": extraction_timestamp,
-            "extraction_origin": extraction_origin
+            "extraction_origin": extraction_origin,
+            # Cache validators for conditional revalidation
+            "etag": response_headers.get('ETag'),
+            "last_modified": response_headers.get('Last-Modified')
         }
         
         return result
         
     except Exception as e:
-        logger.error(f"Extraction failed for {url}: {e}")
+        logger.error("Extraction failed for %s: %s", url, e)
         
         return {
             "text": "",
@@ -6,13 +6,14 @@ types of web pages and content structures.
 """
 
 import logging
+from functools import partial
 from typing import Optional
 from playwright.async_api import Page as async_api_Page
 
 logger = logging.getLogger(__name__)
 
 
-async def extract_with_multiple_strategies(page: async_api_Page) -> str:
+async def extract_with_multiple_strategies(page: async_api_Page, html_content: Optional[str] = None) -> str:
     """
     Extract content using multiple strategies and return the best result.
     
@@ -23,11 +24,15 @@ async def extract_with_multiple_strategies(page: async_api_Page) -> str:
     4. Full page content as fallback
     
     Returns the first strategy that produces substantial content (>500 chars).
+    
+    Args:
+        page: Playwright page instance
+        html_content: Already serialized page HTML; avoids another ``page.content()`` call
     """
     logger.debug("Starting multi-strategy content extraction")
     
     strategies = [
-        ("trafilatura", extract_with_trafilatura),
+        ("trafilatura", partial(extract_with_trafilatura, html_content=html_content)),
         ("text_content", extract_text_content),
         ("readable_content", extract_readable_content),
         ("full_content", extract_full_content)
@@ -37,30 +42,33 @@ async def extract_with_multiple_strategies(page: async_api_Page) -> str:
         try:
             content = await strategy_func(page)
             if content and len(content.strip()) > 500:
-                logger.debug(f"Strategy '{strategy_name}' successful: {len(content)} characters")
+                logger.debug("Strategy '%s' successful: %s characters", strategy_name, len(content))
                 return content.strip()
             else:
-                logger.debug(f"Strategy '{strategy_name}' insufficient content: {len(content) if content else 0} characters")
+                logger.debug("Strategy '%s' insufficient content: %s characters", strategy_name, len(content) if content else 0)
         except Exception as e:
-            logger.warning(f"Strategy '{strategy_name}' failed: {e}")
+            logger.warning("Strategy '%s' failed: %s", strategy_name, e)
     
     # If no strategy produces substantial content, return the best we have
     logger.debug("No strategy produced substantial content, using fallback")
     try:
         return await extract_full_content(page)
     except Exception as e:
-        logger.error(f"All extraction strategies failed: {e}")
+        logger.error("All extraction strategies failed: %s", e)
         return ""
 
 
-async def extract_with_trafilatura(page: async_api_Page) -> str:
+async def extract_with_trafilatura(page: async_api_Page, html_content: Optional[str] = None) -> str:
     """
     Extract content using Trafilatura from page HTML.
+    
+    Uses ``html_content`` when given instead of serializing the page again.
     """
     try:
         import trafilatura
         
-        html_content = await page.content()
+        if html_content is None:
+            html_content = await page.content()
         extracted = trafilatura.extract(html_content)
         return extracted or ""
         
@@ -68,7 +76,7 @@ async def extract_with_trafilatura(page: async_api_Page) -> str:
         logger.warning("Trafilatura not available")
         return ""
     except Exception as e:
-        logger.warning(f"Trafilatura extraction failed: {e}")
+        logger.warning("Trafilatura extraction failed: %s", e)
         return ""
 
 
@@ -102,7 +110,7 @@ async def extract_text_content(page: async_api_Page) -> str:
         return content.strip() if content else ""
         
     except Exception as e:
-        logger.warning(f"Text content extraction failed: {e}")
+        logger.warning("Text content extraction failed: %s", e)
         return ""
 
 
@@ -172,7 +180,7 @@ async def extract_readable_content(page: async_api_Page) -> str:
         return content.strip() if content else ""
         
     except Exception as e:
-        logger.warning(f"Readable content extraction failed: {e}")
+        logger.warning("Readable content extraction failed: %s", e)
         return ""
 
 
@@ -187,5 +195,5 @@ async def extract_full_content(page: async_api_Page) -> str:
         return content.strip() if content else ""
         
     except Exception as e:
-        logger.warning(f"Full content extraction failed: {e}")
+        logger.warning("Full content extraction failed: %s", e)
         return ""
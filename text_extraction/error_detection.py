@@ -43,7 +43,7 @@ async def detect_error_page(page: async_api_Page, content: str) -> Tuple[bool, O
         title_lower = title.lower()
         for error_indicator in error_titles:
             if error_indicator in title_lower:
-                logger.debug(f"Error page detected via title: {error_indicator}")
+                logger.debug("Error page detected via title: %s", error_indicator)
                 return True, f"error_title_{error_indicator}"
         
         # Check for error indicators in content
@@ -60,7 +60,7 @@ async def detect_error_page(page: async_api_Page, content: str) -> Tuple[bool, O
             
             for error_indicator in http_errors:
                 if error_indicator in content_lower:
-                    logger.debug(f"Error page detected via content: {error_indicator}")
+                    logger.debug("Error page detected via content: %s", error_indicator)
                     return True, f"http_error_{error_indicator.replace(' ', '_')}"
             
             # Cloudflare/security challenge indicators
@@ -72,7 +72,7 @@ async def detect_error_page(page: async_api_Page, content: str) -> Tuple[bool, O
             
             for security_indicator in security_indicators:
                 if security_indicator in content_lower:
-                    logger.debug(f"Security challenge detected: {security_indicator}")
+                    logger.debug("Security challenge detected: %s", security_indicator)
                     return True, f"security_challenge_{security_indicator.replace(' ', '_')}"
         
         # Check if content is suspiciously short (might be an error page)
@@ -85,7 +85,7 @@ async def detect_error_page(page: async_api_Page, content: str) -> Tuple[bool, O
             content_lower = content.lower()
             for error_indicator in short_content_errors:
                 if error_indicator in content_lower:
-                    logger.debug(f"Short error content detected: {error_indicator}")
+                    logger.debug("Short error content detected: %s", error_indicator)
                     return True, f"short_error_{error_indicator}"
         
         # Check page status via JavaScript if possible
@@ -109,16 +109,16 @@ async def detect_error_page(page: async_api_Page, content: str) -> Tuple[bool, O
             """)
             
             if page_status:
-                logger.debug(f"Error page detected via DOM selector: {page_status}")
+                logger.debug("Error page detected via DOM selector: %s", page_status)
                 return True, f"dom_error_{page_status.replace('.', '').replace('#', '')}"
                 
         except Exception as e:
-            logger.debug(f"Could not check page status via JavaScript: {e}")
+            logger.debug("Could not check page status via JavaScript: %s", e)
         
         return False, None
         
     except Exception as e:
-        logger.warning(f"Error page detection failed: {e}")
+        logger.warning("Error page detection failed: %s", e)
         return False, None
 
 
@@ -148,10 +148,10 @@ async def fallback_extraction_strategies(page: async_api_Page) -> Tuple[str, str
         try:
             content = await strategy_func(page)
             if content and len(content.strip()) > 50:  # Minimum threshold
-                logger.debug(f"Fallback strategy '{strategy_name}' successful: {len(content)} characters")
+                logger.debug("Fallback strategy '%s' successful: %s characters", strategy_name, len(content))
                 return content.strip(), strategy_name
         except Exception as e:
-            logger.warning(f"Fallback strategy '{strategy_name}' failed: {e}")
+            logger.warning("Fallback strategy '%s' failed: %s", strategy_name, e)
     
     logger.warning("All fallback strategies failed")
     return "", "fallback_failed"
@@ -165,7 +165,7 @@ async def networkidle_extraction(page: async_api_Page) -> str:
         await page.wait_for_load_state("networkidle", timeout=10000)
         return await page.evaluate("() => document.body.textContent || ''")
     except Exception as e:
-        logger.warning(f"Network idle extraction failed: {e}")
+        logger.warning("Network idle extraction failed: %s", e)
         return ""
 
 
@@ -178,7 +178,7 @@ async def content_indicators_extraction(page: async_api_Page) -> str:
         await page.wait_for_selector("main, article, .content, #content", timeout=10000)
         return await page.evaluate("() => document.body.textContent || ''")
     except Exception as e:
-        logger.warning(f"Content indicators extraction failed: {e}")
+        logger.warning("Content indicators extraction failed: %s", e)
         return ""
 
 
@@ -200,7 +200,7 @@ async def progressive_extraction(page: async_api_Page) -> str:
         return await page.evaluate("() => document.body.textContent || ''")
         
     except Exception as e:
-        logger.warning(f"Progressive extraction failed: {e}")
+        logger.warning("Progressive extraction failed: %s", e)
         return ""
 
 
@@ -211,5 +211,5 @@ async def basic_extraction(page: async_api_Page) -> str:
     try:
         return await page.evaluate("() => document.body.textContent || ''")
     except Exception as e:
-        logger.warning(f"Basic extraction failed: {e}")
+        logger.warning("Basic extraction failed: %s", e)
         return ""
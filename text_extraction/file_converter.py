@@ -65,7 +65,7 @@ def convert_file_to_markdown(
         except ImportError:
             logger.warning("MarkItDown not available, trying fallback conversion")
         except Exception as e:
-            logger.warning(f"MarkItDown conversion failed: {e}")
+            logger.warning("MarkItDown conversion failed: %s", e)
         
         # Fallback to basic conversion methods
         converted_text, format_info = _convert_with_fallback(
@@ -88,7 +88,7 @@ def convert_file_to_markdown(
         }
         
     except Exception as e:
-        logger.error(f"File conversion failed: {e}")
+        logger.error("File conversion failed: %s", e)
         return "", {
             "converted": False,
             "reason": f"error: {str(e)}",
@@ -144,7 +144,7 @@ def _convert_with_markitdown(
     except ImportError:
         raise ImportError("MarkItDown not available")
     except Exception as e:
-        logger.error(f"MarkItDown conversion error: {e}")
+        logger.error("MarkItDown conversion error: %s", e)
         return "", {"format": "unknown"}
 
 
@@ -176,7 +176,7 @@ def _convert_with_fallback(
         return "", {"format": file_format.upper()}
         
     except Exception as e:
-        logger.error(f"Fallback conversion error: {e}")
+        logger.error("Fallback conversion error: %s", e)
         return "", {"format": "unknown"}
 
 
@@ -222,7 +222,7 @@ def _convert_pdf_fallback(content: bytes, timeout_seconds: int) -> Tuple[str, Di
         logger.warning("pdftotext not available or timed out")
         return "", {"format": "PDF"}
     except Exception as e:
-        logger.error(f"PDF fallback conversion error: {e}")
+        logger.error("PDF fallback conversion error: %s", e)
         return "", {"format": "PDF"}
 
 
@@ -297,7 +297,7 @@ def _markdown_to_text(markdown_text: str) -> str:
         return text
         
     except Exception as e:
-        logger.warning(f"Markdown to text conversion failed: {e}")
+        logger.warning("Markdown to text conversion failed: %s", e)
         return markdown_text
 
 
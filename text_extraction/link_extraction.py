@@ -67,7 +67,7 @@ def extract_links_from_html(html_content: str, base_url: str) -> List[Dict[str,
                 links.append(link_info)
                 
             except Exception as e:
-                logger.warning(f"Failed to process link {anchor}: {e}")
+                logger.warning("Failed to process link %s: %s", anchor, e)
                 continue
         
         # Remove duplicates while preserving order
@@ -78,11 +78,11 @@ def extract_links_from_html(html_content: str, base_url: str) -> List[Dict[str,
                 seen_urls.add(link["url"])
                 unique_links.append(link)
         
-        logger.info(f"Extracted {len(unique_links)} unique links from HTML content")
+        logger.info("Extracted %s unique links from HTML content", len(unique_links))
         return unique_links
         
     except Exception as e:
-        logger.error(f"Link extraction failed: {e}")
+        logger.error("Link extraction failed: %s", e)
         return []  # Always return empty list instead of None
 
 
@@ -145,7 +145,7 @@ def classify_link_type(url: str, text: str, anchor_element) -> str:
         return 'content'
         
     except Exception as e:
-        logger.warning(f"Link classification failed: {e}")
+        logger.warning("Link classification failed: %s", e)
         return 'unknown'
 
 
@@ -191,12 +191,12 @@ def filter_and_deduplicate_links(links: List[Dict[str, Any]], max_links: int = 1
         # Limit to max_links
         if len(sorted_links) > max_links:
             sorted_links = sorted_links[:max_links]
-            logger.info(f"Limited links to {max_links} most relevant ones")
+            logger.info("Limited links to %s most relevant ones", max_links)
         
         return sorted_links
         
     except Exception as e:
-        logger.error(f"Link filtering failed: {e}")
+        logger.error("Link filtering failed: %s", e)
         return links[:max_links] if links else []
 
 
@@ -239,7 +239,7 @@ def analyze_link_patterns(links: List[Dict[str, Any]]) -> Dict[str, Any]:
         return analysis
         
     except Exception as e:
-        logger.error(f"Link pattern analysis failed: {e}")
+        logger.error("Link pattern analysis failed: %s", e)
         return {
             "total_links": 0,
             "internal_links": 0,
@@ -16,9 +16,12 @@ Supports 25+ file formats including:
 import asyncio
 import io
 import logging
+import os
 import re
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
@@ -100,6 +103,104 @@ class MarkItDownConversionError(Exception):
     """Custom exception for MarkItDown conversion errors."""
     pass
 
+
+def _markitdown_convert_bytes(md, content: bytes, file_format: str) -> str:
+    """Convert raw file bytes with a MarkItDown instance and return stripped markdown."""
+    stream = io.BytesIO(content)
+    stream.seek(0)
+
+    try:
+        result = md.convert(stream, file_extension=f".{file_format}")
+    except TypeError:
+        # Some converters expect a path on disk – fall back to a temp file
+        with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            temp_path = Path(temp_file.name)
+
+        try:
+            result = md.convert(str(temp_path))
+        finally:
+            try:
+                temp_path.unlink()
+            except Exception:
+                pass
+    except Exception as exc:  # pragma: no cover - defensive
+        raise MarkItDownConversionError(f"MarkItDown conversion error: {exc}") from exc
+
+    markdown = getattr(result, "markdown", None) or getattr(result, "text_content", None)
+    if not markdown:
+        raise MarkItDownConversionError("MarkItDown returned no textual content")
+
+    return markdown.strip()
+
+
+# Warm conversion worker pool: each worker imports MarkItDown (and its heavy
+# pdfminer/openpyxl/... converters) once in the initializer, so requests do not
+# pay the import cost and conversions run outside the service process.
+# MARKITDOWN_POOL_WORKERS=0 disables the pool and converts in a thread instead.
+MARKITDOWN_POOL_WORKERS = int(os.getenv("MARKITDOWN_POOL_WORKERS", "2"))
+MARKITDOWN_POOL_MAX_TASKS = int(os.getenv("MARKITDOWN_POOL_MAX_TASKS", "100"))
+
+_worker_markitdown = None
+_conversion_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _preload_markitdown() -> None:
+    """Worker initializer: build the MarkItDown instance once per process."""
+    global _worker_markitdown
+    import markitdown
+    _worker_markitdown = markitdown.MarkItDown()
+
+
+def _warm_up_worker() -> bool:
+    """No-op task used to force the pool to spawn its workers."""
+    return _worker_markitdown is not None
+
+
+def _convert_in_worker(content: bytes, file_format: str) -> str:
+    """Conversion entry point executed inside a pool worker."""
+    if _worker_markitdown is None:
+        _preload_markitdown()
+    return _markitdown_convert_bytes(_worker_markitdown, content, file_format)
+
+
+def get_conversion_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared conversion worker pool, creating it on first use.
+    
+    Returns:
+        ProcessPoolExecutor, or None when the pool is disabled or MarkItDown is missing
+    """
+    global _conversion_pool
+    
+    if _conversion_pool is None and MARKITDOWN_POOL_WORKERS > 0 and is_markitdown_available():
+        _conversion_pool = ProcessPoolExecutor(
+            max_workers=MARKITDOWN_POOL_WORKERS,
+            initializer=_preload_markitdown,
+            max_tasks_per_child=MARKITDOWN_POOL_MAX_TASKS,
+        )
+    
+    return _conversion_pool
+
+
+def start_conversion_pool() -> None:
+    """Pre-spawn the conversion workers so the first file request finds them warm."""
+    pool = get_conversion_pool()
+    if pool is None:
+        return
+    for _ in range(MARKITDOWN_POOL_WORKERS):
+        pool.submit(_warm_up_worker)
+
+
+def shutdown_conversion_pool() -> None:
+    """Stop the conversion worker pool, if it was started."""
+    global _conversion_pool
+    
+    if _conversion_pool is not None:
+        _conversion_pool.shutdown(wait=False, cancel_futures=True)
+        _conversion_pool = None
+
 class MarkItDownConverter:
     """Async MarkItDown-based file converter.
     
@@ -138,7 +239,7 @@ class MarkItDownConverter:
             self.markitdown = markitdown.MarkItDown()
             self.logger.info("MarkItDown converter initialized successfully")
         except Exception as e:
-            self.logger.error(f"Failed to initialize MarkItDown: {e}")
+            self.logger.error("Failed to initialize MarkItDown: %s", e)
             raise MarkItDownConversionError(f"MarkItDown initialization failed: {e}")
 
     @staticmethod
@@ -287,44 +388,30 @@ class MarkItDownConverter:
             return result_text, metadata
 
         except Exception as e:
-            self.logger.error(f"MarkItDown conversion failed: {e}")
+            self.logger.error("MarkItDown conversion failed: %s", e)
             raise MarkItDownConversionError(f"Conversion failed: {e}")
 
     async def _convert_file_async(self, content: bytes, file_format: str) -> str:
         """Async wrapper for MarkItDown conversion."""
-        def _convert() -> str:
-            stream = io.BytesIO(content)
-            stream.seek(0)
-
-            try:
-                result = self.markitdown.convert(stream, file_extension=f".{file_format}")
-            except TypeError:
-                # Some converters expect a path on disk – fall back to a temp file
-                with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as temp_file:
-                    temp_file.write(content)
-                    temp_file.flush()
-                    temp_path = Path(temp_file.name)
-
-                try:
-                    result = self.markitdown.convert(str(temp_path))
-                finally:
-                    try:
-                        temp_path.unlink()
-                    except Exception:
-                        pass
-            except Exception as exc:  # pragma: no cover - defensive
-                raise MarkItDownConversionError(f"MarkItDown conversion error: {exc}") from exc
-
-            markdown = getattr(result, "markdown", None) or getattr(result, "text_content", None)
-            if not markdown:
-                raise MarkItDownConversionError("MarkItDown returned no textual content")
-
-            return markdown.strip()
-
-        # Run conversion in thread pool with timeout
+        pool = get_conversion_pool()
+        
         try:
+            if pool is not None:
+                # Run conversion in a warm worker process with timeout
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.get_running_loop().run_in_executor(
+                            pool, _convert_in_worker, content, file_format
+                        ),
+                        timeout=self.timeout_seconds,
+                    )
+                except BrokenProcessPool as e:
+                    self.logger.warning("Conversion worker pool broken, converting in thread: %s", e)
+                    shutdown_conversion_pool()
+            
+            # Run conversion in thread pool with timeout
             return await asyncio.wait_for(
-                asyncio.to_thread(_convert),
+                asyncio.to_thread(_markitdown_convert_bytes, self.markitdown, content, file_format),
                 timeout=self.timeout_seconds,
             )
         except asyncio.TimeoutError:
@@ -349,7 +436,7 @@ class MarkItDownConverter:
         if not self.is_youtube_url(youtube_url):
             raise MarkItDownConversionError("Invalid YouTube URL")
         
-        self.logger.info(f"Converting YouTube video: {youtube_url}")
+        self.logger.info("Converting YouTube video: %s", youtube_url)
         
         try:
             result = await self._convert_youtube_async(youtube_url)
@@ -361,11 +448,11 @@ class MarkItDownConverter:
                 'conversion_method': 'markitdown_youtube'
             }
             
-            self.logger.info(f"Successfully converted YouTube video ({len(result)} characters)")
+            self.logger.info("Successfully converted YouTube video (%s characters)", len(result))
             return result, metadata
             
         except Exception as e:
-            self.logger.error(f"YouTube conversion failed: {e}")
+            self.logger.error("YouTube conversion failed: %s", e)
             raise MarkItDownConversionError(f"YouTube conversion failed: {e}")
     
     async def _convert_youtube_async(self, youtube_url: str) -> str:
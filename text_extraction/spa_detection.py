@@ -92,11 +92,11 @@ async def detect_spa_characteristics(page: async_api_Page) -> bool:
             }
         """)
         
-        logger.debug(f"SPA detection score: {spa_indicators['score']}, indicators: {spa_indicators['indicators']}")
+        logger.debug("SPA detection score: %s, indicators: %s", spa_indicators['score'], spa_indicators['indicators'])
         return spa_indicators['isSpa']
         
     except Exception as e:
-        logger.warning(f"Error during SPA detection: {e}")
+        logger.warning("Error during SPA detection: %s", e)
         return False
 
 
@@ -7,12 +7,147 @@ and dynamic content loading scenarios.
 
 import logging
 import asyncio
-from typing import Dict, Any
+import json
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from playwright.async_api import Page as async_api_Page
 from .spa_detection import detect_spa_characteristics
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
+# Reused decoder for parsing JSON embedded in larger script bodies
+_JSON_DECODER = json.JSONDecoder()
+
+# Script tags with embedded educational JSON (embedded-topic id, type="json", *topic* ids)
+_EMBEDDED_SCRIPT_RE = re.compile(
+    r'<script(?:[^>]*id="embedded-topic"|[^>]*type="json"|[^>]*id="[^"]*topic[^"]*")[^>]*>(.*?)</script>',
+    re.DOTALL
+)
+# CDATA wrappers and HTML comment markers around embedded JSON
+_SCRIPT_WRAPPER_RE = re.compile(r'<!--//--><!\[CDATA\[//>|//--><!\]\]>|<!--|-->')
+
+# Limits how many pages run the expensive SPA waiting strategies at once so
+# concurrent tabs do not starve the Chromium renderer (SPA_WAIT_CONCURRENCY)
+_SPA_WAIT_SEM = asyncio.Semaphore(int(os.getenv("SPA_WAIT_CONCURRENCY", "5")))
+
+# Page-side helpers used by the SPA waiting strategies (part of SPA_HELPERS_JS)
+_SPA_WAIT_HELPERS_JS = """
+// Install the shared mutation observer (idempotent), return the significant change count
+window.__spaInstallObserver = () => {
+    if (window.__spaObs) {
+        return window.__significantChanges;
+    }
+
+    window.__lastMutation = performance.now();
+    window.__significantChanges = 0;
+    window.__spaObs = new MutationObserver((mutations) => {
+        window.__lastMutation = performance.now();
+        for (const mutation of mutations) {
+            if (mutation.type !== 'childList') {
+                continue;
+            }
+            // Count added nodes that contain significant content
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    const text = node.textContent || '';
+                    if (text.length > 50 && !text.includes('JavaScript wird benötigt')) {
+                        window.__significantChanges++;
+                    }
+                }
+            }
+        }
+    });
+    window.__spaObs.observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true
+    });
+    return 0;
+};
+
+// True once the DOM has not changed for stableTime ms
+window.__spaCheckStable = (stableTime) => {
+    return window.__lastMutation !== undefined && performance.now() - window.__lastMutation > stableTime;
+};
+
+// Root fiber of the React app, if any. [data-reactroot] is gone since React 17,
+// so look at the container: legacy roots keep _reactRootContainer, createRoot
+// (React 18+) stores the fiber under a __reactContainer$<key> property
+window.__reactRootFiber = () => {
+    for (const container of document.querySelectorAll('#root, #app, #__next, [data-reactroot]')) {
+        const legacyRoot = container._reactRootContainer;
+        if (legacyRoot) {
+            const internalRoot = legacyRoot._internalRoot || legacyRoot;
+            if (internalRoot.current) return internalRoot.current;
+        }
+        const containerKey = Object.keys(container).find(key => key.startsWith('__reactContainer$'));
+        if (containerKey) return container[containerKey];
+        if (container._reactInternalFiber) return container._reactInternalFiber;
+    }
+    return null;
+};
+
+window.__spaDisconnectObserver = () => {
+    if (window.__spaObs) {
+        window.__spaObs.disconnect();
+        delete window.__spaObs;
+        delete window.__lastMutation;
+        delete window.__significantChanges;
+    }
+};
+
+// Push every non-empty string leaf of a JSON-like value into `out` without re-serializing it.
+// Depth and item caps guard against cyclic or pathologically large state trees.
+window.__collectStrings = (value, out, depth = 0) => {
+    if (depth > 20 || out.length > 5000) {
+        return;
+    }
+    if (typeof value === 'string') {
+        if (value.length) out.push(value);
+        return;
+    }
+    if (value && typeof value === 'object') {
+        if (Array.isArray(value)) {
+            for (const item of value) window.__collectStrings(item, out, depth + 1);
+        } else {
+            for (const key in value) window.__collectStrings(value[key], out, depth + 1);
+        }
+    }
+};
+"""
+
+# Common SPA loading indicators, queried as one combined selector
+_LOADING_SELECTOR = ", ".join([
+    '.loading', '.spinner', '.loader', '[data-loading]',
+    '.loading-spinner', '.loading-overlay', '.preloader',
+    '[aria-label*="loading"]', '[aria-label*="Loading"]'
+])
+
+# Hosts that are always treated as ultra-complex SPAs without running the
+# in-page scoring probe
+_ULTRA_COMPLEX_HOSTS = frozenset({'kmap.eu'})
+# Host prefixes that only add to the probe's score, never decide on their own
+_ULTRA_COMPLEX_PREFIXES = ('app.', 'dashboard.', 'admin.')
+_ULTRA_COMPLEX_DOMAINS = list(_ULTRA_COMPLEX_HOSTS) + list(_ULTRA_COMPLEX_PREFIXES)
+
+# Per-hostname results of the ultra-complex probe: host -> (timestamp, result)
+_HOST_ULTRA_CACHE: Dict[str, Tuple[float, bool]] = {}
+_HOST_ULTRA_CACHE_TTL = 300  # seconds
+
 
 async def enhanced_spa_extraction(page: async_api_Page, url: str) -> Dict[str, Any]:
     """
@@ -25,6 +160,23 @@ async def enhanced_spa_extraction(page: async_api_Page, url: str) -> Dict[str, A
     - Error page detection
     - Content stability monitoring
     - Ultra-complex SPAs like kmap.eu
+    
+    Collects both stages of enhanced_spa_extraction_stream into a single dict.
+    """
+    result: Dict[str, Any] = {}
+    async for stage in enhanced_spa_extraction_stream(page, url):
+        result.update(stage)
+    result.pop('stage', None)
+    return result
+
+
+async def enhanced_spa_extraction_stream(page: async_api_Page, url: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of enhanced_spa_extraction.
+    
+    Yields a ``{'stage': 'content', ...}`` dict as soon as content has been
+    extracted from the settled page, then runs error page detection and
+    yields a final ``{'stage': 'metadata', ...}`` dict.
     """
     logger.debug("Starting enhanced SPA extraction")
     
@@ -34,21 +186,15 @@ async def enhanced_spa_extraction(page: async_api_Page, url: str) -> Dict[str, A
     # Step 2: Check for ultra-complex SPAs that need special handling
     is_ultra_complex = await detect_ultra_complex_spa(page, url)
     
-    # Step 3: Choose appropriate waiting strategy
-    if is_ultra_complex:
-        logger.debug("Ultra-complex SPA detected - using maximum aggressive strategies")
-        await ultra_complex_spa_wait(page)
-        extraction_method = "ultra_complex_spa"
-    elif is_spa:
-        logger.debug("SPA detected - using advanced waiting strategies")
-        await spa_content_wait(page)
-        extraction_method = "spa_optimized"
+    # Step 3: Wait for content; SPA waits are bounded, regular sites are not throttled
+    if is_ultra_complex or is_spa:
+        async with _SPA_WAIT_SEM:
+            extraction_method = await _wait_for_page_content(page, is_spa, is_ultra_complex)
     else:
-        logger.debug("Regular site detected - using standard waiting")
-        await standard_content_wait(page)
-        extraction_method = "standard_optimized"
+        extraction_method = await _wait_for_page_content(page, is_spa, is_ultra_complex)
     
-    # Step 4: Monitor content stability with extended patience for complex SPAs
+    # Step 4: Let the content settle before it is snapshotted, with extended
+    # patience for complex SPAs
     content_stable = await monitor_content_stability(page, max_wait=15 if is_ultra_complex else 8)
     if content_stable:
         logger.debug("Content stability achieved")
@@ -59,36 +205,76 @@ async def enhanced_spa_extraction(page: async_api_Page, url: str) -> Dict[str, A
     from .content_extraction_strategies import extract_with_multiple_strategies
     from .error_detection import detect_error_page
     
+    # Serialize the DOM once and share it with all HTML-based extractors
+    try:
+        html_content = await page.content()
+    except Exception as e:
+        logger.warning("Could not serialize page content: %s", e)
+        html_content = None
+    
     # Step 5: Extract content with enhanced strategies for complex SPAs
     # Always try embedded JSON extraction first for kmap.eu
     if 'kmap.eu' in url:
         logger.debug("kmap.eu detected - trying embedded JSON extraction first")
-        content = await extract_embedded_json_content(page)
+        content = extract_embedded_json_content(html_content or "")
         if len(content) > 500:
-            logger.debug(f"Embedded JSON extraction successful: {len(content)} chars")
+            logger.debug("Embedded JSON extraction successful: %s chars", len(content))
             extraction_method = "embedded_json_extraction"
         else:
             logger.debug("Embedded JSON extraction failed, falling back to ultra-complex strategies")
-            content = await extract_ultra_complex_spa_content(page)
+            content = await extract_ultra_complex_spa_content(page, html_content=html_content)
     elif is_ultra_complex:
-        content = await extract_ultra_complex_spa_content(page)
+        content = await extract_ultra_complex_spa_content(page, html_content=html_content)
     else:
-        content = await extract_with_multiple_strategies(page)
+        content = await extract_with_multiple_strategies(page, html_content=html_content)
     
-    # Step 6: Detect if this is an error page
-    is_error_page, error_type = await detect_error_page(page, content)
+    if is_spa or is_ultra_complex:
+        await _disconnect_mutation_observer(page)
     
-    return {
+    yield {
+        'stage': 'content',
         'content': content,
         'extraction_method': extraction_method,
         'is_spa': is_spa,
-        'is_ultra_complex': is_ultra_complex,
+        'is_ultra_complex': is_ultra_complex
+    }
+    
+    # Step 6: Detect if this is an error page
+    if extraction_method == "embedded_json_extraction" and len(content) > 500:
+        # Structured topic JSON was parsed successfully - this is not an error page
+        is_error_page, error_type = False, None
+    else:
+        is_error_page, error_type = await detect_error_page(page, content)
+    
+    yield {
+        'stage': 'metadata',
         'is_error_page': is_error_page,
         'error_type': error_type,
         'content_stable': content_stable
     }
 
 
+async def _wait_for_page_content(page: async_api_Page, is_spa: bool, is_ultra_complex: bool) -> str:
+    """
+    Run the waiting strategy matching the detected page type.
+    
+    Returns:
+        str: Extraction method name for the chosen strategy
+    """
+    if is_ultra_complex:
+        logger.debug("Ultra-complex SPA detected - using maximum aggressive strategies")
+        await ultra_complex_spa_wait(page)
+        return "ultra_complex_spa"
+    if is_spa:
+        logger.debug("SPA detected - using advanced waiting strategies")
+        await spa_content_wait(page)
+        return "spa_optimized"
+    
+    logger.debug("Regular site detected - using standard waiting")
+    await standard_content_wait(page)
+    return "standard_optimized"
+
+
 async def spa_content_wait(page: async_api_Page):
     """
     Specialized waiting strategy for SPAs using robust DOM stability monitoring.
@@ -117,7 +303,7 @@ async def spa_content_wait(page: async_api_Page):
         logger.debug("SPA content waiting completed successfully")
         
     except Exception as e:
-        logger.warning(f"SPA content wait failed: {e}")
+        logger.warning("SPA content wait failed: %s", e)
         # Fallback to basic wait
         await asyncio.sleep(3)
 
@@ -134,73 +320,89 @@ async def wait_for_spa_stability(page: async_api_Page, network_idle_timeout=3000
     """
     try:
         # 1. Auf Netzwerkruhe warten
-        logger.debug(f"Waiting for network idle (timeout: {network_idle_timeout}ms)")
+        logger.debug("Waiting for network idle (timeout: %sms)", network_idle_timeout)
         await page.wait_for_load_state('networkidle', timeout=network_idle_timeout)
         
-        # 2. MutationObserver im Seitenkontext einrichten
+        # 2. Gemeinsamen MutationObserver im Seitenkontext sicherstellen
         logger.debug("Setting up DOM mutation observer")
-        await page.evaluate("""
-            () => {
-                // Letzte Mutation-Zeit merken
-                window.__lastMutation = performance.now();
-                // Observer, der Timestamp bei jeder Mutation updatet
-                window.__mutationObserver = new MutationObserver(() => {
-                    window.__lastMutation = performance.now();
-                });
-                window.__mutationObserver.observe(document, {
-                    childList: true,
-                    subtree: true,
-                    attributes: true,
-                    characterData: true
-                });
-            }
-        """)
+        await _ensure_mutation_observer(page)
 
         # 3. Auf eine Periode ohne Änderungen warten
         remaining_timeout = max_total_timeout - network_idle_timeout
-        logger.debug(f"Waiting for DOM stability ({stable_time}ms without mutations, timeout: {remaining_timeout}ms)")
+        logger.debug("Waiting for DOM stability (%sms without mutations, timeout: %sms)", stable_time, remaining_timeout)
         await page.wait_for_function(
-            f"() => performance.now() - window.__lastMutation > {stable_time}",
+            "(stableTime) => window.__spaCheckStable(stableTime)",
+            arg=stable_time,
             timeout=remaining_timeout
         )
         
         logger.debug("DOM stability achieved")
         
     except Exception as e:
-        logger.warning(f"SPA stability wait failed: {e}")
-    finally:
-        # 4. Observer aufräumen (immer ausführen, auch bei Fehlern)
-        try:
-            await page.evaluate("""
-                () => {
-                    if (window.__mutationObserver) {
-                        window.__mutationObserver.disconnect();
-                        delete window.__mutationObserver;
-                        delete window.__lastMutation;
-                    }
-                }
-            """)
-            logger.debug("Mutation observer cleaned up")
-        except Exception as cleanup_error:
-            logger.warning(f"Observer cleanup failed: {cleanup_error}")
+        logger.warning("SPA stability wait failed: %s", e)
+
+
+async def _call_spa_helper(page: async_api_Page, expression: str) -> Any:
+    """
+    Evaluate a call into the page-side SPA helpers.
+    
+    The helpers are normally registered once per context via
+    ``context.add_init_script(SPA_HELPERS_JS)``. Pages created without them
+    get the helpers injected on first use.
+    """
+    call = f"async () => window.__spaHelpers ? {{ value: await {expression} }} : null"
+    result = await page.evaluate(call)
+    if result is None:
+        await page.evaluate(SPA_HELPERS_JS)
+        result = await page.evaluate(call)
+    return result['value'] if result else None
+
+
+async def _ensure_mutation_observer(page: async_api_Page) -> int:
+    """
+    Install the shared DOM mutation observer once per page.
+    
+    The observer keeps ``window.__lastMutation`` (timestamp of the latest
+    mutation) and ``window.__significantChanges`` (added nodes carrying real
+    content) up to date for all waiting strategies. Installing it again is a
+    no-op, so back-to-back waits do not re-register subtree observation.
+    
+    Returns:
+        int: Current significant change count, usable as a baseline
+    """
+    return await _call_spa_helper(page, "window.__spaInstallObserver()")
+
+
+async def _disconnect_mutation_observer(page: async_api_Page) -> None:
+    """Disconnect the shared mutation observer once extraction is complete."""
+    try:
+        await _call_spa_helper(page, "window.__spaDisconnectObserver()")
+        logger.debug("Mutation observer cleaned up")
+    except Exception as cleanup_error:
+        logger.warning("Observer cleanup failed: %s", cleanup_error)
 
 
 async def wait_for_spa_indicators(page: async_api_Page):
     """Wait for common SPA loading indicators to disappear."""
-    loading_selectors = [
-        '.loading', '.spinner', '.loader', '[data-loading]',
-        '.loading-spinner', '.loading-overlay', '.preloader',
-        '[aria-label*="loading"]', '[aria-label*="Loading"]'
-    ]
-    
-    for selector in loading_selectors:
-        try:
-            # Wait for loading indicator to be hidden (if it exists)
-            await page.wait_for_selector(selector, state='hidden', timeout=5000)
-            logger.debug(f"Loading indicator {selector} disappeared")
-        except Exception:
-            # Selector not found or timeout - that's fine
-            continue
+    try:
+        # Single snapshot of all loading indicators currently in the DOM
+        found = await page.evaluate(
+            "(sel) => document.querySelectorAll(sel).length",
+            _LOADING_SELECTOR
+        )
+        if not found:
+            return
+        
+        # Wait until every indicator is hidden or removed
+        await page.wait_for_function(
+            "(sel) => [...document.querySelectorAll(sel)].every(n => n.offsetParent === null)",
+            arg=_LOADING_SELECTOR,
+            timeout=5000
+        )
+        logger.debug("%s loading indicator(s) disappeared", found)
+    except Exception:
+        # Timeout or evaluation error - that's fine
+        pass
 
 
 async def check_framework_readiness(page: async_api_Page):
@@ -232,7 +434,7 @@ async def check_framework_readiness(page: async_api_Page):
             logger.debug("Framework not fully ready, but proceeding")
             
     except Exception as e:
-        logger.debug(f"Framework readiness check failed: {e}")
+        logger.debug("Framework readiness check failed: %s", e)
 
 
 async def standard_content_wait(page: async_api_Page):
@@ -245,7 +447,14 @@ async def standard_content_wait(page: async_api_Page):
         await page.wait_for_load_state("networkidle", timeout=8000)
         logger.debug("Standard content wait completed")
     except Exception as e:
-        logger.warning(f"Standard content wait failed: {e}")
+        logger.warning("Standard content wait failed: %s", e)
+
+
+def _content_digest(content: str) -> int:
+    """Fast digest of page HTML for change detection."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(content.encode("utf-8"))
+    return hash(content)
 
 
 async def monitor_content_stability(page: async_api_Page, max_wait: int = 8):
@@ -263,12 +472,13 @@ async def monitor_content_stability(page: async_api_Page, max_wait: int = 8):
         try:
             # Get current page content hash
             current_content = await page.content()
-            current_hash = hash(current_content)
+            # Hash multi-MB HTML off the event loop so other tabs keep progressing
+            current_hash = await asyncio.to_thread(_content_digest, current_content)
             
             if current_hash == previous_content_hash:
                 stable_count += 1
                 if stable_count >= 3:  # Stable for 3 seconds
-                    logger.debug(f"Content stable after {i+1} seconds")
+                    logger.debug("Content stable after %s seconds", i+1)
                     return True
             else:
                 stable_count = 0
@@ -277,13 +487,35 @@ async def monitor_content_stability(page: async_api_Page, max_wait: int = 8):
             await asyncio.sleep(1)
             
         except Exception as e:
-            logger.warning(f"Error during stability monitoring: {e}")
+            logger.warning("Error during stability monitoring: %s", e)
             break
     
     logger.debug("Content stability timeout reached")
     return False
 
 
+def _is_ultra_complex_host(url: str) -> bool:
+    """Check whether the URL's hostname alone marks it as an ultra-complex SPA."""
+    hostname = (urlparse(url).hostname or '').lower()
+    if not hostname:
+        return False
+    return hostname in _ULTRA_COMPLEX_HOSTS or any(hostname.endswith('.' + host) for host in _ULTRA_COMPLEX_HOSTS)
+
+
+def _get_cached_host_result(hostname: str) -> Optional[bool]:
+    """Return a fresh cached probe result for the hostname, evicting expired entries."""
+    if not hostname:
+        return None
+    
+    now = time.monotonic()
+    expired = [host for host, (stored_at, _) in _HOST_ULTRA_CACHE.items() if now - stored_at > _HOST_ULTRA_CACHE_TTL]
+    for host in expired:
+        del _HOST_ULTRA_CACHE[host]
+    
+    entry = _HOST_ULTRA_CACHE.get(hostname)
+    return entry[1] if entry else None
+
+
 async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
     """
     Detect ultra-complex SPAs that require special handling.
@@ -296,10 +528,21 @@ async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
     """
     logger.debug("Detecting ultra-complex SPA characteristics")
     
+    # Fast path: known ultra-complex hosts need no in-page probe
+    if _is_ultra_complex_host(url):
+        logger.debug("Ultra-complex SPA detected via hostname: %s", url)
+        return True
+    
+    hostname = urlparse(url).hostname or ''
+    cached = _get_cached_host_result(hostname)
+    if cached is not None:
+        logger.debug("Ultra-complex SPA detection cached for %s: %s", hostname, cached)
+        return cached
+    
     try:
         # Check for known ultra-complex SPA patterns
         ultra_complex_indicators = await page.evaluate("""
-            () => {
+            (complexDomains) => {
                 let score = 0;
                 const indicators = {};
                 
@@ -313,6 +556,7 @@ async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
                     'Wird geladen...'
                 ];
                 
+                // Whole-document text: SPA shells often render outside <main>/#app
                 const bodyText = document.body.textContent || '';
                 for (const placeholder of placeholderTexts) {
                     if (bodyText.includes(placeholder)) {
@@ -323,7 +567,8 @@ async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
                 }
                 
                 // Check for complex React patterns
-                if (window.React && (window.__REACT_DEVTOOLS_GLOBAL_HOOK__ || document.querySelector('[data-reactroot]'))) {
+                const hasReactRoot = window.__reactRootFiber ? window.__reactRootFiber() !== null : false;
+                if (window.React && (window.__REACT_DEVTOOLS_GLOBAL_HOOK__ || hasReactRoot)) {
                     score += 2;
                     indicators.complexReact = true;
                 }
@@ -354,7 +599,6 @@ async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
                 }
                 
                 // Check for specific ultra-complex SPA domains
-                const complexDomains = ['kmap.eu', 'app.', 'dashboard.', 'admin.'];
                 const currentDomain = window.location.hostname;
                 for (const domain of complexDomains) {
                     if (currentDomain.includes(domain)) {
@@ -370,13 +614,16 @@ async def detect_ultra_complex_spa(page: async_api_Page, url: str) -> bool:
                     isUltraComplex: score >= 4
                 };
             }
-        """)
+        """, _ULTRA_COMPLEX_DOMAINS)
         
-        logger.debug(f"Ultra-complex SPA detection score: {ultra_complex_indicators['score']}, indicators: {ultra_complex_indicators['indicators']}")
-        return ultra_complex_indicators['isUltraComplex']
+        logger.debug("Ultra-complex SPA detection score: %s, indicators: %s", ultra_complex_indicators['score'], ultra_complex_indicators['indicators'])
+        is_ultra_complex = ultra_complex_indicators['isUltraComplex']
+        if hostname:
+            _HOST_ULTRA_CACHE[hostname] = (time.monotonic(), is_ultra_complex)
+        return is_ultra_complex
         
     except Exception as e:
-        logger.warning(f"Error during ultra-complex SPA detection: {e}")
+        logger.warning("Error during ultra-complex SPA detection: %s", e)
         return False
 
 
@@ -398,7 +645,7 @@ async def ultra_complex_spa_wait(page: async_api_Page):
         logger.debug("  - Extended network idle wait...")
         try:
             await page.wait_for_load_state("networkidle", timeout=20000)
-        except:
+        except Exception:
             pass
         
         # Step 2: Wait for framework initialization
@@ -406,128 +653,77 @@ async def ultra_complex_spa_wait(page: async_api_Page):
         await page.evaluate("""
             () => {
                 return new Promise((resolve) => {
-                    let attempts = 0;
-                    const maxAttempts = 100;  // 20 seconds max
-                    
-                    const checkFrameworks = () => {
-                        attempts++;
-                        
-                        // Check for React readiness
-                        if (window.React && window.__REACT_DEVTOOLS_GLOBAL_HOOK__) {
-                            const reactFiber = document.querySelector('[data-reactroot]');
-                            if (reactFiber && reactFiber._reactInternalFiber) {
-                                console.log('React fully initialized');
-                                resolve();
-                                return;
-                            }
-                        }
-                        
-                        // Check for Vue readiness
-                        if (window.Vue && window.Vue.version) {
-                            const vueApp = document.querySelector('[data-v-]');
-                            if (vueApp) {
-                                console.log('Vue fully initialized');
-                                resolve();
-                                return;
-                            }
-                        }
-                        
-                        // Check for any app-specific readiness indicators
-                        if (window.app && window.app.ready) {
-                            console.log('App ready state detected');
-                            resolve();
-                            return;
-                        }
-                        
-                        if (attempts >= maxAttempts) {
-                            console.log('Framework initialization timeout');
-                            resolve();
-                        } else {
-                            setTimeout(checkFrameworks, 200);
-                        }
+                    // 20 seconds max
+                    const timer = setTimeout(() => {
+                        console.log('Framework initialization timeout');
+                        resolve();
+                    }, 20000);
+                    const ready = (source) => {
+                        clearTimeout(timer);
+                        console.log(`${source} ready signal received`);
+                        resolve();
                     };
                     
-                    checkFrameworks();
-                });
-            }
-        """)
-        
-        # Step 3: Deep DOM mutation monitoring
-        logger.debug("  - Deep DOM mutation monitoring...")
-        await page.evaluate("""
-            () => {
-                return new Promise((resolve) => {
-                    let mutationCount = 0;
-                    let lastMutationTime = Date.now();
-                    let significantChanges = 0;
-                    
-                    const observer = new MutationObserver((mutations) => {
-                        mutations.forEach((mutation) => {
-                            if (mutation.type === 'childList' && mutation.addedNodes.length > 0) {
-                                // Check if added nodes contain significant content
-                                for (const node of mutation.addedNodes) {
-                                    if (node.nodeType === Node.ELEMENT_NODE) {
-                                        const text = node.textContent || '';
-                                        if (text.length > 50 && !text.includes('JavaScript wird benötigt')) {
-                                            significantChanges++;
-                                        }
-                                    }
-                                }
-                            }
-                        });
-                        
-                        mutationCount++;
-                        lastMutationTime = Date.now();
-                    });
+                    // Check for any app-specific readiness indicators
+                    if (window.app && window.app.ready) {
+                        ready('App');
+                        return;
+                    }
                     
-                    observer.observe(document.body, {
-                        childList: true,
-                        subtree: true,
-                        attributes: true,
-                        attributeOldValue: true
-                    });
+                    let hasReadySignal = false;
                     
-                    // Check every 500ms for stability or significant changes
-                    const checkStability = () => {
-                        const now = Date.now();
-                        if (significantChanges >= 3) {
-                            console.log('Significant content changes detected');
-                            observer.disconnect();
-                            resolve();
-                        } else if (now - lastMutationTime > 3000) {  // 3 seconds of stability
-                            console.log('DOM mutations stabilized');
-                            observer.disconnect();
-                            resolve();
-                        } else {
-                            setTimeout(checkStability, 500);
-                        }
-                    };
+                    // React: resolve on the next committed fiber root
+                    const hook = window.__REACT_DEVTOOLS_GLOBAL_HOOK__;
+                    if (hook) {
+                        hasReadySignal = true;
+                        const originalCommit = hook.onCommitFiberRoot;
+                        hook.onCommitFiberRoot = function (...args) {
+                            hook.onCommitFiberRoot = originalCommit;
+                            const result = originalCommit ? originalCommit.apply(this, args) : undefined;
+                            ready('React');
+                            return result;
+                        };
+                    }
                     
-                    setTimeout(checkStability, 500);
+                    // Vue: resolve after the next render tick
+                    if (window.Vue && window.app && typeof window.app.$nextTick === 'function') {
+                        hasReadySignal = true;
+                        window.app.$nextTick(() => ready('Vue'));
+                    }
                     
-                    // Maximum wait time of 15 seconds
-                    setTimeout(() => {
-                        observer.disconnect();
-                        resolve();
-                    }, 15000);
+                    // Nothing to wait for without a framework ready signal
+                    if (!hasReadySignal) {
+                        ready('No framework');
+                    }
                 });
             }
         """)
         
+        # Step 3: Deep DOM mutation monitoring via the shared observer
+        logger.debug("  - Deep DOM mutation monitoring...")
+        baseline_changes = await _ensure_mutation_observer(page)
+        try:
+            # Resolve on significant content changes or 3 seconds of stability
+            await page.wait_for_function(
+                "(baseline) => window.__significantChanges - baseline >= 3 || window.__spaCheckStable(3000)",
+                arg=baseline_changes,
+                polling=500,
+                timeout=15000
+            )
+        except Exception:
+            logger.debug("DOM mutation monitoring timed out")
+        
         # Step 4: Simulate user interactions to trigger content loading
         logger.debug("  - Simulating user interactions...")
         try:
-            # Try clicking on potential navigation elements
-            await page.evaluate("""
-                () => {
-                    const clickableElements = document.querySelectorAll('button, [role="button"], a[href="#"], .nav-item, .menu-item');
-                    if (clickableElements.length > 0) {
-                        clickableElements[0].click();
-                    }
-                }
-            """)
+            # Click the first potential navigation element with Playwright's actionability checks
+            await page.locator('button, [role="button"], a[href="#"], .nav-item, .menu-item').first.click(
+                timeout=1500,
+                no_wait_after=True
+            )
             await asyncio.sleep(2)
-        except:
+        except Exception:
+            # No clickable element or not actionable - skip the post-click wait
             pass
         
         # Step 5: Force rendering through scrolling
@@ -536,28 +732,30 @@ async def ultra_complex_spa_wait(page: async_api_Page):
             await page.evaluate("""
                 () => {
                     return new Promise((resolve) => {
-                        let scrollTop = 0;
                         const scrollStep = 300;
-                        const maxScroll = Math.max(document.body.scrollHeight, 2000);
+                        const maxScroll = 20000;
                         
+                        // Scroll once per painted frame until the page stops growing
                         const scroll = () => {
-                            window.scrollTo(0, scrollTop);
-                            scrollTop += scrollStep;
+                            const previousY = window.scrollY;
+                            window.scrollBy(0, scrollStep);
                             
-                            if (scrollTop >= maxScroll) {
+                            const moved = window.scrollY > previousY;
+                            const atBottom = window.scrollY + window.innerHeight >= document.body.scrollHeight;
+                            if (moved && !atBottom && window.scrollY < maxScroll) {
+                                requestAnimationFrame(scroll);
+                            } else {
                                 // Scroll back to top
                                 window.scrollTo(0, 0);
-                                setTimeout(resolve, 1000);
-                            } else {
-                                setTimeout(scroll, 200);
+                                requestAnimationFrame(resolve);
                             }
                         };
                         
-                        scroll();
+                        requestAnimationFrame(scroll);
                     });
                 }
             """)
-        except:
+        except Exception:
             pass
         
         # Step 6: Final wait for any remaining async operations
@@ -567,355 +765,340 @@ async def ultra_complex_spa_wait(page: async_api_Page):
         logger.debug("Ultra-complex SPA wait completed")
         
     except Exception as e:
-        logger.warning(f"Error during ultra-complex SPA wait: {e}")
+        logger.warning("Error during ultra-complex SPA wait: %s", e)
 
 
-async def extract_embedded_json_content(page: async_api_Page) -> str:
-    """Extract educational content from embedded JSON script tags (e.g., kmap.eu)."""
+def _parse_embedded_json(text: str, start: int) -> Any:
+    """
+    Parse the JSON value starting at ``start`` in ``text``.
+    
+    Tries a fast ``orjson`` parse of the remainder first and falls back to
+    ``raw_decode``, which tolerates trailing script code after the object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text[start:])
+        except orjson.JSONDecodeError:
+            pass
+    
+    json_data, _ = _JSON_DECODER.raw_decode(text, start)
+    return json_data
+
+
+def extract_embedded_json_content(html_content: str) -> str:
+    """Extract educational content from embedded JSON script tags (e.g., kmap.eu).
+    
+    Works on already serialized page HTML so callers can share a single
+    ``page.content()`` result across extractors.
+    """
     try:
-        # Get the raw HTML content
-        html_content = await page.content()
-        
-        # Look for embedded JSON content in script tags using regex
-        import re
-        import json
-        
-        # Find script tags with embedded educational content
-        script_patterns = [
-            r'<script id="embedded-topic"[^>]*>(.*?)</script>',
-            r'<script[^>]*type="json"[^>]*>(.*?)</script>',
-            r'<script[^>]*id="[^"]*topic[^"]*"[^>]*>(.*?)</script>'
-        ]
-        
+        # Single scan over all script tags that may carry embedded educational content
         extracted_content = ""
         
-        for pattern in script_patterns:
-            script_matches = re.findall(pattern, html_content, re.DOTALL)
-            
-            for script_content in script_matches:
-                try:
-                    # Clean up the script content
-                    clean_content = script_content
-                    
-                    # Remove CDATA wrappers and HTML comments
-                    clean_content = re.sub(r'<!--//--><!\[CDATA\[//>', '', clean_content)
-                    clean_content = re.sub(r'//--><!\]\]>', '', clean_content)
-                    clean_content = re.sub(r'<!--', '', clean_content)
-                    clean_content = re.sub(r'-->', '', clean_content)
-                    
-                    # Find the JSON content between the first { and last }
-                    start_brace = clean_content.find('{')
-                    end_brace = clean_content.rfind('}')
-                    
-                    if start_brace != -1 and end_brace != -1 and end_brace > start_brace:
-                        clean_content = clean_content[start_brace:end_brace + 1]
-                    
-                    clean_content = clean_content.strip()
-                    
-                    # Try to parse as JSON
-                    json_data = json.loads(clean_content)
-                    
-                    # Extract educational content from the JSON structure
-                    if json_data.get('description'):
-                        # Remove HTML tags from description
-                        description = re.sub(r'<[^>]*>', ' ', json_data['description'])
-                        description = re.sub(r'\s+', ' ', description).strip()
-                        extracted_content += f"Beschreibung:\n{description}\n\n"
-                    
-                    if json_data.get('summary'):
-                        extracted_content += f"Zusammenfassung: {json_data['summary']}\n\n"
-                    
-                    if json_data.get('keywords'):
-                        extracted_content += f"Schlüsselwörter: {json_data['keywords']}\n\n"
-                    
-                    if json_data.get('subject') and json_data.get('topic'):
-                        extracted_content += f"Fach: {json_data['subject']} - Thema: {json_data['topic']}\n\n"
-                    
-                    if json_data.get('educationalLevel'):
-                        extracted_content += f"Bildungsstufe: {json_data['educationalLevel']}\n\n"
-                    
-                    if json_data.get('typicalAgeRange'):
-                        extracted_content += f"Altersbereich: {json_data['typicalAgeRange']}\n\n"
-                    
-                    # Extract attachment information
-                    if json_data.get('attachments') and isinstance(json_data['attachments'], list):
-                        extracted_content += "Anhänge und Ressourcen:\n"
-                        for attachment in json_data['attachments']:
-                            if attachment.get('name'):
-                                tag_info = f" ({attachment['tag']})" if attachment.get('tag') else ""
-                                extracted_content += f"- {attachment['name']}{tag_info}\n"
-                        extracted_content += "\n"
-                    
-                    # If we found content, break out of the loop
-                    if extracted_content.strip():
-                        break
-                        
-                except (json.JSONDecodeError, Exception) as parse_error:
-                    logger.debug(f"Failed to parse embedded JSON: {parse_error}")
+        for match in _EMBEDDED_SCRIPT_RE.finditer(html_content):
+            script_content = match.group(1)
+            try:
+                # Clean up the script content
+                clean_content = script_content
+                
+                # Remove CDATA wrappers and HTML comments
+                clean_content = _SCRIPT_WRAPPER_RE.sub('', clean_content)
+                
+                # Parse the JSON object starting at the first {
+                start_brace = clean_content.find('{')
+                if start_brace == -1:
                     continue
+                
+                json_data = _parse_embedded_json(clean_content, start_brace)
+                if not isinstance(json_data, dict):
+                    continue
+                
+                # Extract educational content from the JSON structure
+                if json_data.get('description'):
+                    # Remove HTML tags from description
+                    description = re.sub(r'<[^>]*>', ' ', json_data['description'])
+                    description = re.sub(r'\s+', ' ', description).strip()
+                    extracted_content += f"Beschreibung:\n{description}\n\n"
+                
+                if json_data.get('summary'):
+                    extracted_content += f"Zusammenfassung: {json_data['summary']}\n\n"
+                
+                if json_data.get('keywords'):
+                    extracted_content += f"Schlüsselwörter: {json_data['keywords']}\n\n"
+                
+                if json_data.get('subject') and json_data.get('topic'):
+                    extracted_content += f"Fach: {json_data['subject']} - Thema: {json_data['topic']}\n\n"
+                
+                if json_data.get('educationalLevel'):
+                    extracted_content += f"Bildungsstufe: {json_data['educationalLevel']}\n\n"
+                
+                if json_data.get('typicalAgeRange'):
+                    extracted_content += f"Altersbereich: {json_data['typicalAgeRange']}\n\n"
+                
+                # Extract attachment information
+                if json_data.get('attachments') and isinstance(json_data['attachments'], list):
+                    extracted_content += "Anhänge und Ressourcen:\n"
+                    for attachment in json_data['attachments']:
+                        if attachment.get('name'):
+                            tag_info = f" ({attachment['tag']})" if attachment.get('tag') else ""
+                            extracted_content += f"- {attachment['name']}{tag_info}\n"
+                    extracted_content += "\n"
+                
+                # If we found content, break out of the loop
+                if extracted_content.strip():
+                    break
+                    
+            except (json.JSONDecodeError, Exception) as parse_error:
+                logger.debug("Failed to parse embedded JSON: %s", parse_error)
+                continue
         
         return extracted_content.strip()
         
     except Exception as e:
-        logger.warning(f"Embedded JSON extraction failed: {e}")
+        logger.warning("Embedded JSON extraction failed: %s", e)
         return ""
 
 
+_JS_SVG_INTERACTIVE = """
+() => {
+    // Extract from SVG text elements across the whole document
+    const svgText = [...document.querySelectorAll('svg text, svg tspan, svg title, svg desc')]
+        .map(el => (el.textContent || '').trim())
+        .filter(text => text.length > 2)
+        .join(' ');
+
+    // Look for educational content containers
+    const selectors = [
+        '[class*="content"]', '[class*="lesson"]', '[class*="concept"]',
+        '[class*="definition"]', '[class*="explanation"]', '[class*="description"]',
+        '[id*="content"]', '[id*="main"]', '[id*="lesson"]'
+    ].join(',');
+    const keywords = /koordinaten|achse|punkt|raum|dimension/i;
+    const educationalText = [...document.querySelectorAll(selectors)]
+        .map(el => el.textContent || '')
+        .filter(text => text.length > 50 && text.length < 2000 && keywords.test(text))
+        .join(' ');
+
+    return `${svgText} ${educationalText}`.trim();
+}
+"""
+
+
 async def extract_svg_interactive_content(page: async_api_Page) -> str:
     """Extract content from SVG elements and interactive educational components."""
     try:
-        # Simple approach: get all text content from SVG and canvas elements
-        svg_content = await page.evaluate("""
-            () => {
-                let content = '';
-                
-                // Extract from SVG elements
-                const svgs = document.querySelectorAll('svg');
-                for (const svg of svgs) {
-                    const textElements = svg.querySelectorAll('text, tspan, title, desc');
-                    for (const textEl of textElements) {
-                        const text = textEl.textContent || '';
-                        if (text.trim().length > 2) {
-                            content += text.trim() + ' ';
-                        }
-                    }
-                }
-                
-                return content.trim();
-            }
-        """)
-        
-        # Get content from elements that might contain educational material
-        educational_content = await page.evaluate("""
-            () => {
-                let content = '';
-                
-                // Look for educational content containers
-                const selectors = [
-                    '[class*="content"]', '[class*="lesson"]', '[class*="concept"]',
-                    '[class*="definition"]', '[class*="explanation"]', '[class*="description"]',
-                    '[id*="content"]', '[id*="main"]', '[id*="lesson"]'
-                ];
-                
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const element of elements) {
-                        const text = element.textContent || '';
-                        if (text.length > 50 && text.length < 2000) {
-                            // Check if it contains educational keywords
-                            const lowerText = text.toLowerCase();
-                            if (lowerText.includes('koordinaten') || 
-                                lowerText.includes('achse') || 
-                                lowerText.includes('punkt') ||
-                                lowerText.includes('raum') ||
-                                lowerText.includes('dimension')) {
-                                content += text + ' ';
-                            }
-                        }
-                    }
-                }
-                
-                return content.trim();
-            }
-        """)
-        
-        # Combine results
-        combined_content = f"{svg_content} {educational_content}".strip()
-        return combined_content
+        # Single round trip: SVG text plus educational containers matching keywords
+        return await _call_spa_helper(page, "window.__extractSvgInteractive()")
         
     except Exception as e:
-        logger.warning(f"SVG/interactive extraction failed: {e}")
+        logger.warning("SVG/interactive extraction failed: %s", e)
         return ""
 
 
-async def extract_main_content_targeted(page: async_api_Page) -> str:
-    """Extract content by targeting main content areas and excluding navigation."""
-    return await page.evaluate("""
-        () => {
-            try {
-                let content = '';
-                
-                // Target main content selectors (common patterns)
-                const mainSelectors = [
-                    'main', '[role="main"]', '.main-content', '.content-area',
-                    '.main-container', '.page-content', '.article-content',
-                    '.content-wrapper', '.primary-content', '.main-section',
-                    '.content-body', '.page-body', '.article-body',
-                    // Educational content specific selectors
-                    '.lesson-content', '.course-content', '.educational-content',
-                    '.learning-content', '.tutorial-content', '.chapter-content',
-                    // kmap.eu specific patterns
-                    '.knowledge-map', '.concept-content', '.topic-content',
-                    '[data-content]', '[data-main]', '.app-content'
-                ];
-                
-                // Try each main content selector
-                for (const selector of mainSelectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const element of elements) {
-                        const text = element.textContent || '';
-                        if (text.length > 100) {
-                            content += text + ' ';
-                        }
-                    }
+_JS_MAIN_CONTENT = """
+() => {
+    try {
+        const parts = [];
+
+        // Matches arrive in document order, so an element lies inside an
+        // already emitted subtree exactly when the last emitted one contains it
+        let lastEmitted = null;
+        const emit = (element, text) => {
+            parts.push(text);
+            lastEmitted = element;
+        };
+        const isConsumed = (element) => lastEmitted !== null && lastEmitted.contains(element);
+
+        // Rendered text only (skips display:none, script/style). Candidates come from
+        // static querySelectorAll lists and nothing is written to the DOM in between,
+        // so layout is flushed once on the first read.
+        const visibleText = (element) => element.innerText ?? element.textContent ?? '';
+
+        // Target main content selectors (common patterns)
+        const mainSelectors = [
+            'main', '[role="main"]', '.main-content', '.content-area',
+            '.main-container', '.page-content', '.article-content',
+            '.content-wrapper', '.primary-content', '.main-section',
+            '.content-body', '.page-body', '.article-body',
+            // Educational content specific selectors
+            '.lesson-content', '.course-content', '.educational-content',
+            '.learning-content', '.tutorial-content', '.chapter-content',
+            // kmap.eu specific patterns
+            '.knowledge-map', '.concept-content', '.topic-content',
+            '[data-content]', '[data-main]', '.app-content'
+        ];
+
+        // Query all main content selectors in a single DOM walk
+        for (const element of document.querySelectorAll(mainSelectors.join(','))) {
+            if (isConsumed(element)) {
+                continue;
+            }
+            const text = visibleText(element);
+            if (text.length > 100) {
+                emit(element, text);
+            }
+        }
+
+        // If no main content found, look for content containers across the
+        // whole document: a thin <main>/#app shell is exactly the case here
+        if (parts.length === 0) {
+            const contentContainers = document.querySelectorAll(
+                'div[class*="content"], div[id*="content"], ' +
+                'section[class*="content"], article, ' +
+                'div[class*="main"], div[id*="main"]'
+            );
+
+            for (const container of contentContainers) {
+                // Skip nested containers and navigation/header elements
+                if (isConsumed(container) || container.closest('nav, header, .nav, .navigation, .menu')) {
+                    continue;
                 }
-                
-                // If no main content found, look for content containers
-                if (content.length < 100) {
-                    const contentContainers = document.querySelectorAll(
-                        'div[class*="content"], div[id*="content"], ' +
-                        'section[class*="content"], article, ' +
-                        'div[class*="main"], div[id*="main"]'
-                    );
-                    
-                    for (const container of contentContainers) {
-                        // Skip navigation and header elements
-                        if (container.closest('nav, header, .nav, .navigation, .menu')) {
-                            continue;
-                        }
-                        
-                        const text = container.textContent || '';
-                        if (text.length > 50) {
-                            content += text + ' ';
-                        }
-                    }
+
+                const text = visibleText(container);
+                if (text.length > 50) {
+                    emit(container, text);
                 }
-                
-                return content.trim();
-            } catch (e) {
-                return '';
             }
         }
-    """)
 
+        return parts.join(' ').trim();
+    } catch (e) {
+        return '';
+    }
+}
+"""
 
-async def extract_educational_content(page: async_api_Page) -> str:
-    """Extract educational content by looking for specific patterns and structures."""
-    return await page.evaluate("""
-        () => {
-            try {
-                let content = '';
-                
-                // Wait for potential dynamic content loading
-                const waitForContent = () => {
-                    return new Promise((resolve) => {
-                        let attempts = 0;
-                        const checkContent = () => {
-                            attempts++;
-                            
-                            // Look for educational content indicators
-                            const educationalSelectors = [
-                                // Text content areas
-                                'p', 'div[class*="text"]', 'div[class*="description"]',
-                                'div[class*="explanation"]', 'div[class*="definition"]',
-                                // Lists and structured content
-                                'ul', 'ol', 'dl', 'table',
-                                // Headings that might indicate content sections
-                                'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                                // Canvas or interactive elements (common in educational apps)
-                                'canvas', 'svg', '[data-interactive]',
-                                // Form elements that might contain content
-                                'textarea', 'input[type="text"]'
-                            ];
-                            
-                            let foundContent = '';
-                            
-                            for (const selector of educationalSelectors) {
-                                const elements = document.querySelectorAll(selector);
-                                for (const element of elements) {
-                                    // Skip navigation and menu elements
-                                    if (element.closest('nav, .nav, .navigation, .menu, header, footer, .sidebar')) {
-                                        continue;
-                                    }
-                                    
-                                    const text = element.textContent || '';
-                                    
-                                    // Look for substantial content
-                                    if (text.length > 20 && !text.match(/^(Home|Menu|Navigation|Login|Register|Search)$/i)) {
-                                        foundContent += text + ' ';
-                                    }
-                                }
-                            }
-                            
-                            // If we found substantial content or reached max attempts, resolve
-                            if (foundContent.length > 200 || attempts >= 10) {
-                                resolve(foundContent);
-                            } else {
-                                setTimeout(checkContent, 500);
-                            }
-                        };
-                        
-                        checkContent();
-                    });
-                };
-                
-                // Wait for content to load (remove await since we're not in async context)
-                content = '';
-                
-                // Immediate content extraction
-                const educationalSelectors = [
-                    // Text content areas
-                    'p', 'div[class*="text"]', 'div[class*="description"]',
-                    'div[class*="explanation"]', 'div[class*="definition"]',
-                    // Lists and structured content
-                    'ul', 'ol', 'dl', 'table',
-                    // Headings that might indicate content sections
-                    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                    // Canvas or interactive elements (common in educational apps)
-                    'canvas', 'svg', '[data-interactive]',
-                    // Form elements that might contain content
-                    'textarea', 'input[type="text"]'
-                ];
-                
-                for (const selector of educationalSelectors) {
-                    const elements = document.querySelectorAll(selector);
-                    for (const element of elements) {
-                        // Skip navigation and menu elements
-                        if (element.closest('nav, .nav, .navigation, .menu, header, footer, .sidebar')) {
-                            continue;
+
+async def extract_main_content_targeted(page: async_api_Page) -> str:
+    """Extract content by targeting main content areas and excluding navigation."""
+    return await _call_spa_helper(page, "window.__extractMain()")
+
+
+_JS_EDUCATIONAL_CONTENT = """
+() => {
+    try {
+        // Tags that carry educational content: text, lists, tables, headings,
+        // canvas/SVG (common in educational apps) and form fields
+        const acceptedTags = new Set([
+            'P', 'UL', 'OL', 'DL', 'TABLE',
+            'H1', 'H2', 'H3', 'H4', 'H5', 'H6',
+            'CANVAS', 'SVG', 'TEXTAREA'
+        ]);
+        const divClassPattern = /text|description|explanation|definition/;
+        const skippedClasses = ['nav', 'navigation', 'menu', 'sidebar'];
+
+        const isEducational = (node) => {
+            const tag = node.tagName.toUpperCase();
+            if (acceptedTags.has(tag)) return true;
+            if (tag === 'INPUT') return node.type === 'text';
+            if (tag === 'DIV' && divClassPattern.test(node.getAttribute('class') || '')) return true;
+            return node.hasAttribute('data-interactive');
+        };
+
+        // Single forward pass; navigation/menu subtrees are pruned entirely
+        const collectEducationalText = () => {
+            const parts = [];
+            // Nodes arrive in document order: skip descendants of the last emitted node
+            let lastEmitted = null;
+            const walker = document.createTreeWalker(
+                document.body,
+                NodeFilter.SHOW_ELEMENT,
+                {
+                    acceptNode(node) {
+                        const tag = node.tagName.toUpperCase();
+                        if (tag === 'NAV' || tag === 'HEADER' || tag === 'FOOTER') {
+                            return NodeFilter.FILTER_REJECT;
                         }
-                        
-                        const text = element.textContent || '';
-                        
-                        // Look for substantial content
-                        if (text.length > 20 && !text.match(/^(Home|Menu|Navigation|Login|Register|Search)$/i)) {
-                            content += text + ' ';
+                        if (node.classList && skippedClasses.some(cls => node.classList.contains(cls))) {
+                            return NodeFilter.FILTER_REJECT;
                         }
+                        return isEducational(node) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
                     }
                 }
-                
-                // Additional extraction for kmap.eu specific content
-                if (content.length < 200) {
-                    // Look for canvas or SVG content that might contain educational material
-                    const canvasElements = document.querySelectorAll('canvas, svg');
-                    for (const canvas of canvasElements) {
-                        const parent = canvas.parentElement;
-                        if (parent) {
-                            const parentText = parent.textContent || '';
-                            if (parentText.length > 50) {
-                                content += parentText + ' ';
-                            }
-                        }
-                    }
-                    
-                    // Look for data attributes that might contain content
-                    const dataElements = document.querySelectorAll('[data-content], [data-text], [data-description]');
-                    for (const element of dataElements) {
-                        const dataContent = element.getAttribute('data-content') || 
-                                          element.getAttribute('data-text') || 
-                                          element.getAttribute('data-description') || '';
-                        if (dataContent.length > 20) {
-                            content += dataContent + ' ';
-                        }
+            );
+
+            // First pass: pure tree walk, no layout
+            const candidates = [];
+            let node;
+            while ((node = walker.nextNode())) {
+                candidates.push(node);
+            }
+
+            // Second pass: read rendered text so layout is flushed only once.
+            // SVG/canvas elements have no innerText and fall back to textContent.
+            for (const node of candidates) {
+                if (lastEmitted !== null && lastEmitted.contains(node)) {
+                    continue;
+                }
+                const nodeText = node.innerText ?? node.textContent ?? '';
+
+                // Look for substantial content; the length floor also drops bare
+                // navigation labels such as Home/Menu/Login
+                if (nodeText.length > 20) {
+                    parts.push(nodeText);
+                    lastEmitted = node;
+                }
+            }
+            return parts;
+        };
+
+        // Immediate content extraction
+        const parts = collectEducationalText();
+
+        // Additional extraction for kmap.eu specific content
+        if (parts.join(' ').length < 200) {
+            // Look for canvas or SVG content that might contain educational material
+            // Sibling canvases/SVGs share a parent: each parent contributes once
+            const seen = new WeakSet();
+            const canvasElements = document.querySelectorAll('canvas, svg');
+            for (const canvas of canvasElements) {
+                const parent = canvas.parentElement;
+                if (parent && !seen.has(parent)) {
+                    seen.add(parent);
+                    const parentText = parent.textContent || '';
+                    if (parentText.length > 50) {
+                        parts.push(parentText);
                     }
                 }
-                
-                return content.trim();
-            } catch (e) {
-                return '';
+            }
+
+            // Look for data attributes that might contain content
+            const dataElements = document.querySelectorAll('[data-content], [data-text], [data-description]');
+            for (const element of dataElements) {
+                const dataContent = element.getAttribute('data-content') || 
+                                  element.getAttribute('data-text') || 
+                                  element.getAttribute('data-description') || '';
+                if (dataContent.length > 20) {
+                    parts.push(dataContent);
+                }
             }
         }
-    """)
+
+        return parts.join(' ').trim();
+    } catch (e) {
+        return '';
+    }
+}
+"""
+
+
+async def extract_educational_content(page: async_api_Page) -> str:
+    """Extract educational content by looking for specific patterns and structures."""
+    return await _call_spa_helper(page, "window.__extractEducational()")
+
+
+# Keywords signalling that educational content has rendered, passed to the
+# page as an argument so the check script itself stays constant
+_EDU_KWS = ['koordinaten', 'achse', 'punkt', 'raum', 'dimension']
+
+_EDU_CHECK_JS = """
+(keywords) => {
+    // One combined pass over the text instead of one scan per keyword
+    const matches = (document.body.innerText || '').match(new RegExp(keywords.join('|'), 'gi'));
+    const keywordCount = new Set((matches || []).map(match => match.toLowerCase())).size;
+    return keywordCount >= 2 || document.querySelectorAll('svg').length >= 5;
+}
+"""
 
 
 async def wait_for_dynamic_educational_content(page: async_api_Page, timeout: int = 45) -> None:
@@ -924,409 +1107,468 @@ async def wait_for_dynamic_educational_content(page: async_api_Page, timeout: in
         # First, standard network idle wait
         await page.wait_for_load_state('networkidle', timeout=15000)
         
-        # Wait for educational keywords to appear in the DOM
-        educational_keywords = ['koordinaten', 'achse', 'punkt', 'raum', 'dimension']
-        
-        for attempt in range(3):
-            await page.wait_for_timeout(5000)  # Wait 5 seconds between attempts
+        # Wait for educational keywords or SVG content; the check polls inside
+        # the browser instead of one round trip per attempt
+        try:
+            await page.wait_for_function(_EDU_CHECK_JS, arg=_EDU_KWS, timeout=30000, polling=1000)
+            logger.info("Educational content detected, proceeding with extraction")
+        except Exception as e:
+            logger.info("Educational content not detected: %s", e)
             
-            # Check if educational content has appeared
-            content_found = await page.evaluate(f"""
-                () => {{
-                    const keywords = {educational_keywords};
-                    const bodyText = document.body.textContent.toLowerCase();
-                    
-                    // Count how many educational keywords are found
-                    let keywordCount = 0;
-                    keywords.forEach(keyword => {{
-                        if (bodyText.includes(keyword)) {{
-                            keywordCount++;
-                        }}
-                    }});
-                    
-                    // Also check for SVG elements with content
-                    const svgCount = document.querySelectorAll('svg').length;
+            # Try to trigger content loading by scrolling or interaction
+            await page.evaluate("""
+                () => {
+                    // Scroll to trigger lazy loading
+                    window.scrollTo(0, document.body.scrollHeight);
+                    window.scrollTo(0, 0);
                     
-                    return {{
-                        keywordCount: keywordCount,
-                        svgCount: svgCount,
-                        bodyLength: bodyText.length,
-                        hasEducationalContent: keywordCount >= 2 || svgCount >= 5
-                    }};
-                }}
+                    // Try to click on any content areas that might trigger loading
+                    const contentAreas = document.querySelectorAll('main, [role="main"], .content, .app-content');
+                    contentAreas.forEach(area => {
+                        if (area.click) {
+                            area.click();
+                        }
+                    });
+                }
             """)
-            
-            logger.info(f"Dynamic content check attempt {attempt + 1}: {content_found}")
-            
-            if content_found.get('hasEducationalContent', False):
-                logger.info("Educational content detected, proceeding with extraction")
-                break
-                
-            # Try to trigger content loading by scrolling or interaction
-            if attempt < 2:
-                await page.evaluate("""
-                    () => {
-                        // Scroll to trigger lazy loading
-                        window.scrollTo(0, document.body.scrollHeight);
-                        window.scrollTo(0, 0);
-                        
-                        // Try to click on any content areas that might trigger loading
-                        const contentAreas = document.querySelectorAll('main, [role="main"], .content, .app-content');
-                        contentAreas.forEach(area => {
-                            if (area.click) {
-                                area.click();
-                            }
-                        });
-                    }
-                """)  
         
         # Final wait for any remaining async operations
         await page.wait_for_timeout(5000)
         
     except Exception as e:
-        logger.warning(f"Error waiting for dynamic educational content: {e}")
+        logger.warning("Error waiting for dynamic educational content: %s", e)
 
 
-async def extract_ultra_complex_spa_content(page: async_api_Page) -> str:
+async def extract_ultra_complex_spa_content(page: async_api_Page, html_content: Optional[str] = None) -> str:
     """
     Extract content from ultra-complex SPAs using aggressive strategies.
     
     Uses multiple extraction approaches specifically designed for
     complex React/Vue applications that resist normal extraction.
+    
+    Args:
+        page: Playwright page instance
+        html_content: Already serialized page HTML; only reused when the dynamic
+            content wait is skipped, otherwise the page is serialized again
     """
     logger.debug("Starting ultra-complex SPA content extraction")
     
-    # First, wait for dynamic educational content to load
-    await wait_for_dynamic_educational_content(page)
+    # Only wait for dynamic educational content if the page is still sparse
+    try:
+        body_len = await page.evaluate("() => document.body ? document.body.innerText.length : 0")
+    except Exception as e:
+        logger.warning("Could not measure body text: %s", e)
+        body_len = 0
+    if body_len > 2000:
+        logger.debug("Body already has %s characters, skipping dynamic content wait", body_len)
+    else:
+        await wait_for_dynamic_educational_content(page)
+        # Content rendered during the wait is not in the earlier snapshot
+        html_content = None
+    
+    if html_content is None:
+        try:
+            html_content = await page.content()
+        except Exception as e:
+            logger.warning("Could not serialize page content: %s", e)
+            html_content = ""
+    
+    best_content = ""
+    
+    def consider(strategy_name: str, content: str) -> bool:
+        """Track the best result; True once a strategy produced substantial content."""
+        nonlocal best_content
+        logger.debug("  %s: %s characters", strategy_name, len(content))
+        
+        # Use the first strategy that produces substantial content
+        if len(content) > 500:
+            logger.debug("Strategy '%s' successful with %s characters", strategy_name, len(content))
+            best_content = content
+            return True
+        
+        # Keep track of the best content so far
+        if len(content) > len(best_content):
+            best_content = content
+        return False
     
+    # Embedded JSON needs no page round trip
+    try:
+        if consider("embedded_json_extraction", extract_embedded_json_content(html_content)):
+            return best_content
+    except Exception as e:
+        logger.warning("Strategy 'embedded_json_extraction' failed: %s", e)
+    
+    # Evaluates share the page's single renderer, so run them one at a time,
+    # cheapest first, and stop at the first substantial result. Frame
+    # traversal and polling cost real time, so they run last.
     strategies = [
-        ("embedded_json_extraction", extract_embedded_json_content),
-        ("svg_interactive_extraction", extract_svg_interactive_content),
         ("main_content_targeting", extract_main_content_targeted),
         ("educational_content_extraction", extract_educational_content),
+        ("svg_interactive_extraction", extract_svg_interactive_content),
         ("react_fiber_extraction", extract_react_fiber_content),
         ("vue_component_extraction", extract_vue_component_content),
         ("shadow_dom_extraction", extract_shadow_dom_content),
-        ("iframe_content_extraction", extract_iframe_content),
-        ("dynamic_content_polling", extract_dynamic_content_polling),
         ("javascript_state_extraction", extract_javascript_state),
-        ("aggressive_text_mining", extract_aggressive_text_mining)
+        ("aggressive_text_mining", extract_aggressive_text_mining),
+        ("iframe_content_extraction", extract_iframe_content),
+        ("dynamic_content_polling", extract_dynamic_content_polling)
     ]
-    
-    best_content = ""
-    
     for strategy_name, strategy_func in strategies:
         try:
-            content = await strategy_func(page)
-            logger.debug(f"  {strategy_name}: {len(content)} characters")
-            
-            # Use the first strategy that produces substantial content
-            if len(content) > 500:
-                logger.debug(f"Strategy '{strategy_name}' successful with {len(content)} characters")
-                return content
-            
-            # Keep track of the best content so far
-            if len(content) > len(best_content):
-                best_content = content
-                
+            if consider(strategy_name, await strategy_func(page) or ""):
+                return best_content
         except Exception as e:
-            logger.warning(f"Strategy '{strategy_name}' failed: {e}")
+            logger.warning("Strategy '%s' failed: %s", strategy_name, e)
     
-    logger.debug(f"All strategies completed, best content: {len(best_content)} characters")
+    logger.debug("All strategies completed, best content: %s characters", len(best_content))
     return best_content
 
 
+_JS_REACT_FIBER = """
+() => {
+    try {
+        // Try to access React Fiber
+        const fiber = window.__reactRootFiber();
+        if (fiber) {
+
+            // Traverse the fiber tree iteratively: no recursion depth limit
+            // and a single join instead of repeated string concatenation
+            const out = [];
+            const stack = [fiber];
+            while (stack.length) {
+                const node = stack.pop();
+                if (!node) continue;
+
+                // Check if this node has text content
+                const children = node.memoizedProps && node.memoizedProps.children;
+                if (typeof children === 'string') {
+                    out.push(children);
+                }
+
+                // Push the sibling first so the child subtree is visited next
+                if (node.sibling) stack.push(node.sibling);
+                if (node.child) stack.push(node.child);
+            }
+
+            return out.join(' ');
+        }
+
+        return '';
+    } catch (e) {
+        return '';
+    }
+}
+"""
+
+
 async def extract_react_fiber_content(page: async_api_Page) -> str:
     """Extract content from React Fiber trees."""
-    return await page.evaluate("""
-        () => {
-            try {
-                // Try to access React Fiber
-                const reactRoot = document.querySelector('[data-reactroot]') || document.querySelector('#root');
-                if (reactRoot && reactRoot._reactInternalFiber) {
-                    const fiber = reactRoot._reactInternalFiber;
-                    
-                    // Traverse the fiber tree to extract text content
-                    const extractFiberText = (node) => {
-                        if (!node) return '';
-                        
-                        let text = '';
-                        
-                        // Check if this node has text content
-                        if (node.memoizedProps && typeof node.memoizedProps.children === 'string') {
-                            text += node.memoizedProps.children + ' ';
-                        }
-                        
-                        // Recursively check child fibers
-                        if (node.child) {
-                            text += extractFiberText(node.child);
-                        }
-                        
-                        // Check sibling fibers
-                        if (node.sibling) {
-                            text += extractFiberText(node.sibling);
+    return await _call_spa_helper(page, "window.__extractReactFiber()")
+
+
+_JS_VUE_COMPONENTS = """
+() => {
+    try {
+        const collectStrings = window.__collectStrings;
+        const strings = [];
+
+        // Vue 3: the app sits on its mount container; walk the component tree
+        // through the rendered vnodes
+        const container = document.querySelector('[data-v-app]') || document.body;
+        const app = container.__vue_app__;
+        if (app && app._instance) {
+            const stack = [app._instance.subTree];
+            collectStrings(app._instance.data, strings);
+            collectStrings(app._instance.setupState, strings);
+            while (stack.length && strings.length <= 5000) {
+                const vnode = stack.pop();
+                if (!vnode) continue;
+                if (vnode.component) {
+                    collectStrings(vnode.component.data, strings);
+                    collectStrings(vnode.component.setupState, strings);
+                    stack.push(vnode.component.subTree);
+                }
+                if (Array.isArray(vnode.children)) {
+                    for (const child of vnode.children) {
+                        if (child && typeof child === 'object') stack.push(child);
+                    }
+                }
+            }
+            return strings.join(' ');
+        }
+
+        // Vue 2: component root elements carry their instance in __vue__
+        const seen = new Set();
+        for (const element of document.body.querySelectorAll('*')) {
+            const vue = element.__vue__;
+            if (!vue || seen.has(vue)) {
+                continue;
+            }
+            seen.add(vue);
+
+            // Extract readable text from Vue instance data
+            if (vue.$data) {
+                collectStrings(vue.$data, strings);
+            }
+
+            // Extract computed properties
+            if (vue.$options.computed) {
+                for (const key in vue.$options.computed) {
+                    try {
+                        const value = vue[key];
+                        if (typeof value === 'string' && value.length > 10) {
+                            strings.push(value);
                         }
-                        
-                        return text;
-                    };
-                    
-                    return extractFiberText(fiber);
+                    } catch (e) {}
                 }
-                
-                return '';
-            } catch (e) {
-                return '';
             }
         }
-    """)
+
+        const content = strings.length ? strings.join(' ') + ' ' : '';
+        return content;
+    } catch (e) {
+        return '';
+    }
+}
+"""
 
 
 async def extract_vue_component_content(page: async_api_Page) -> str:
     """Extract content from Vue component trees."""
-    return await page.evaluate("""
-        () => {
-            try {
-                // Try to access Vue instances
-                const vueElements = document.querySelectorAll('[data-v-]');
-                let content = '';
-                
-                for (const element of vueElements) {
-                    if (element.__vue__) {
-                        const vue = element.__vue__;
-                        
-                        // Extract data from Vue instance
-                        if (vue.$data) {
-                            const dataStr = JSON.stringify(vue.$data);
-                            // Extract readable text from data
-                            const textMatches = dataStr.match(/"[^"]*"/g);
-                            if (textMatches) {
-                                content += textMatches.join(' ').replace(/"/g, '') + ' ';
-                            }
-                        }
-                        
-                        // Extract computed properties
-                        if (vue.$options.computed) {
-                            for (const key in vue.$options.computed) {
-                                try {
-                                    const value = vue[key];
-                                    if (typeof value === 'string' && value.length > 10) {
-                                        content += value + ' ';
-                                    }
-                                } catch (e) {}
-                            }
-                        }
-                    }
+    return await _call_spa_helper(page, "window.__extractVueComponents()")
+
+
+_JS_SHADOW_DOM = """
+() => {
+    try {
+        // Find all elements with shadow roots. querySelectorAll walks the tree
+        // natively, avoiding a JS filter callback per element; tag names are not
+        // enough since open shadow roots can be attached to plain elements too.
+        const parts = [];
+        for (const host of document.body.querySelectorAll('*')) {
+            if (host.shadowRoot) {
+                const shadowContent = host.shadowRoot.textContent || '';
+                if (shadowContent.length > 10) {
+                    parts.push(shadowContent);
                 }
-                
-                return content;
-            } catch (e) {
-                return '';
             }
         }
-    """)
+
+        return parts.length ? parts.join(' ') + ' ' : '';
+    } catch (e) {
+        return '';
+    }
+}
+"""
 
 
 async def extract_shadow_dom_content(page: async_api_Page) -> str:
     """Extract content from Shadow DOM elements."""
-    return await page.evaluate("""
-        () => {
-            try {
-                let content = '';
-                
-                // Find all elements with shadow roots
-                const walker = document.createTreeWalker(
-                    document.body,
-                    NodeFilter.SHOW_ELEMENT,
-                    {
-                        acceptNode: function(node) {
-                            return node.shadowRoot ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
-                        }
-                    }
-                );
-                
-                let node;
-                while (node = walker.nextNode()) {
-                    if (node.shadowRoot) {
-                        const shadowContent = node.shadowRoot.textContent || '';
-                        if (shadowContent.length > 10) {
-                            content += shadowContent + ' ';
-                        }
-                    }
-                }
-                
-                return content;
-            } catch (e) {
-                return '';
-            }
-        }
-    """)
+    return await _call_spa_helper(page, "window.__extractShadowDom()")
 
 
 async def extract_iframe_content(page: async_api_Page) -> str:
     """Extract content from iframes."""
     try:
         iframes = await page.query_selector_all('iframe')
-        content = ''
         
-        for iframe in iframes:
+        async def read_iframe(iframe) -> str:
             try:
                 iframe_content = await iframe.content_frame()
-                if iframe_content:
-                    iframe_text = await iframe_content.text_content('body')
-                    if iframe_text and len(iframe_text) > 50:
-                        content += iframe_text + ' '
-            except:
-                continue
+                if not iframe_content:
+                    return ''
+                iframe_text = await iframe_content.text_content('body')
+                return iframe_text + ' ' if iframe_text and len(iframe_text) > 50 else ''
+            except Exception:
+                return ''
         
-        return content
-    except:
+        # Frames are read concurrently so the round trips overlap
+        parts = await asyncio.gather(*(read_iframe(iframe) for iframe in iframes))
+        return ''.join(parts)
+    except Exception:
         return ''
 
 
+_JS_DYNAMIC_CONTENT_POLLING = """
+() => {
+    return new Promise((resolve) => {
+        let bestContent = '';
+        let done = false;
+
+        const considerContent = () => {
+            // Get current content
+            const currentContent = document.body.textContent || '';
+
+            // Filter out placeholder messages
+            if (currentContent.length > bestContent.length &&
+                !currentContent.includes('JavaScript wird benötigt') &&
+                !currentContent.includes('Loading...')) {
+                bestContent = currentContent;
+            }
+        };
+
+        const finish = () => {
+            if (done) return;
+            done = true;
+            observer.disconnect();
+            clearTimeout(deadline);
+            resolve(bestContent);
+        };
+
+        // Re-read the body only when the DOM actually changes, for up to 4 seconds
+        const observer = new MutationObserver(() => {
+            considerContent();
+            if (bestContent.length > 1000) {
+                finish();
+            }
+        });
+        const deadline = setTimeout(finish, 4000);
+
+        considerContent();
+        if (bestContent.length > 1000) {
+            finish();
+            return;
+        }
+        observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    });
+}
+"""
+
+
 async def extract_dynamic_content_polling(page: async_api_Page) -> str:
     """Poll for dynamic content changes over time."""
-    return await page.evaluate("""
-        () => {
-            return new Promise((resolve) => {
-                let bestContent = '';
-                let attempts = 0;
-                const maxAttempts = 20;  // 4 seconds of polling
-                
-                const pollContent = () => {
-                    attempts++;
-                    
-                    // Get current content
-                    const currentContent = document.body.textContent || '';
-                    
-                    // Filter out placeholder messages
-                    if (currentContent.length > bestContent.length && 
-                        !currentContent.includes('JavaScript wird benötigt') &&
-                        !currentContent.includes('Loading...')) {
-                        bestContent = currentContent;
-                    }
-                    
-                    if (attempts >= maxAttempts || bestContent.length > 1000) {
-                        resolve(bestContent);
-                    } else {
-                        setTimeout(pollContent, 200);
-                    }
-                };
-                
-                pollContent();
-            });
+    return await _call_spa_helper(page, "window.__extractDynamicContent()")
+
+
+_JS_JAVASCRIPT_STATE = """
+() => {
+    try {
+        const collectStrings = window.__collectStrings;
+        const strings = [];
+
+        // Check for Redux store
+        if (window.__REDUX_STORE__) {
+            collectStrings(window.__REDUX_STORE__.getState(), strings);
         }
-    """)
+
+        // Check for Vuex store
+        if (window.__VUE_DEVTOOLS_GLOBAL_HOOK__ && window.__VUE_DEVTOOLS_GLOBAL_HOOK__.store) {
+            const store = window.__VUE_DEVTOOLS_GLOBAL_HOOK__.store;
+            if (store.state) {
+                collectStrings(store.state, strings);
+            }
+        }
+
+        // Check for any global app state
+        const globalKeys = ['appState', 'applicationState', 'state', 'store', 'data'];
+        for (const key of globalKeys) {
+            if (window[key] && typeof window[key] === 'object') {
+                try {
+                    collectStrings(window[key], strings);
+                } catch (e) {}
+            }
+        }
+
+        return strings.length ? strings.join(' ') + ' ' : '';
+    } catch (e) {
+        return '';
+    }
+}
+"""
 
 
 async def extract_javascript_state(page: async_api_Page) -> str:
     """Extract content from JavaScript application state."""
-    return await page.evaluate("""
-        () => {
+    return await _call_spa_helper(page, "window.__extractJavascriptState()")
+
+
+_JS_AGGRESSIVE_TEXT_MINING = """
+() => {
+    try {
+        const collectStrings = window.__collectStrings;
+        let content = '';
+
+        // Extract from structured JSON script tags
+        const jsonParts = [];
+        const jsonScripts = document.querySelectorAll(
+            'script[type="application/ld+json"], script[type="application/json"]'
+        );
+        for (const script of jsonScripts) {
             try {
-                let content = '';
-                
-                // Check for Redux store
-                if (window.__REDUX_STORE__) {
-                    const state = window.__REDUX_STORE__.getState();
-                    const stateStr = JSON.stringify(state);
-                    // Extract readable text from state
-                    const textMatches = stateStr.match(/"[^"]*"/g);
-                    if (textMatches) {
-                        content += textMatches.join(' ').replace(/"/g, '') + ' ';
-                    }
-                }
-                
-                // Check for Vuex store
-                if (window.__VUE_DEVTOOLS_GLOBAL_HOOK__ && window.__VUE_DEVTOOLS_GLOBAL_HOOK__.store) {
-                    const store = window.__VUE_DEVTOOLS_GLOBAL_HOOK__.store;
-                    if (store.state) {
-                        const stateStr = JSON.stringify(store.state);
-                        const textMatches = stateStr.match(/"[^"]*"/g);
-                        if (textMatches) {
-                            content += textMatches.join(' ').replace(/"/g, '') + ' ';
-                        }
-                    }
-                }
-                
-                // Check for any global app state
-                const globalKeys = ['appState', 'applicationState', 'state', 'store', 'data'];
-                for (const key of globalKeys) {
-                    if (window[key] && typeof window[key] === 'object') {
-                        try {
-                            const stateStr = JSON.stringify(window[key]);
-                            const textMatches = stateStr.match(/"[^"]*"/g);
-                            if (textMatches) {
-                                content += textMatches.join(' ').replace(/"/g, '') + ' ';
-                            }
-                        } catch (e) {}
-                    }
+                collectStrings(JSON.parse(script.textContent || ''), jsonParts);
+            } catch (e) {}
+        }
+        if (jsonParts.length) {
+            content += jsonParts.join(' ') + ' ';
+        }
+
+        // Extract from data attributes ('[data-*]' is not a valid selector,
+        // so walk the elements and read their dataset directly)
+        const dataParts = [];
+        const dataWalker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+        let element;
+        while ((element = dataWalker.nextNode())) {
+            const dataset = element.dataset;
+            for (const key in dataset) {
+                const value = dataset[key];
+                if (value && value.length > 10) {
+                    dataParts.push(value);
                 }
-                
-                return content;
-            } catch (e) {
-                return '';
             }
         }
-    """)
+        if (dataParts.length) {
+            content += dataParts.join(' ') + ' ';
+        }
 
+        // Extract from comments (sometimes contains data)
+        const walker = document.createTreeWalker(
+            document.body,
+            NodeFilter.SHOW_COMMENT,
+            null,
+            false
+        );
 
-async def extract_aggressive_text_mining(page: async_api_Page) -> str:
-    """Aggressively mine text from all possible sources."""
-    return await page.evaluate(r"""
-        () => {
-            try {
-                let content = '';
-                
-                // Extract from all script tags (looking for JSON data)
-                const scripts = document.querySelectorAll('script');
-                for (const script of scripts) {
-                    const scriptContent = script.textContent || '';
-                    
-                    // Look for JSON data in scripts
-                    const jsonMatches = scriptContent.match(/\{[^}]*"[^"]*"[^}]*\}/g);
-                    if (jsonMatches) {
-                        for (const match of jsonMatches) {
-                            try {
-                                const obj = JSON.parse(match);
-                                const objStr = JSON.stringify(obj);
-                                const textMatches = objStr.match(/"[^"]*"/g);
-                                if (textMatches) {
-                                    content += textMatches.join(' ').replace(/"/g, '') + ' ';
-                                }
-                            } catch (e) {}
-                        }
-                    }
-                }
-                
-                // Extract from data attributes
-                const elementsWithData = document.querySelectorAll('[data-*]');
-                for (const element of elementsWithData) {
-                    for (const attr of element.attributes) {
-                        if (attr.name.startsWith('data-') && attr.value.length > 10) {
-                            content += attr.value + ' ';
-                        }
-                    }
-                }
-                
-                // Extract from comments (sometimes contains data)
-                const walker = document.createTreeWalker(
-                    document.body,
-                    NodeFilter.SHOW_COMMENT,
-                    null,
-                    false
-                );
-                
-                let node;
-                while (node = walker.nextNode()) {
-                    const commentText = node.textContent || '';
-                    if (commentText.length > 20 && !commentText.includes('<!--')) {
-                        content += commentText + ' ';
-                    }
-                }
-                
-                return content;
-            } catch (e) {
-                return '';
+        let node;
+        while (node = walker.nextNode()) {
+            const commentText = node.textContent || '';
+            if (commentText.length > 20 && !commentText.includes('<!--')) {
+                content += commentText + ' ';
             }
         }
-    """)
+
+        return content;
+    } catch (e) {
+        return '';
+    }
+}
+"""
+
+
+async def extract_aggressive_text_mining(page: async_api_Page) -> str:
+    """Aggressively mine text from all possible sources."""
+    return await _call_spa_helper(page, "window.__extractAggressiveText()")
+
+
+# Extraction strategy scripts exposed as window helpers
+_EXTRACTION_HELPERS = {
+    '__extractSvgInteractive': _JS_SVG_INTERACTIVE,
+    '__extractMain': _JS_MAIN_CONTENT,
+    '__extractEducational': _JS_EDUCATIONAL_CONTENT,
+    '__extractReactFiber': _JS_REACT_FIBER,
+    '__extractVueComponents': _JS_VUE_COMPONENTS,
+    '__extractShadowDom': _JS_SHADOW_DOM,
+    '__extractDynamicContent': _JS_DYNAMIC_CONTENT_POLLING,
+    '__extractJavascriptState': _JS_JAVASCRIPT_STATE,
+    '__extractAggressiveText': _JS_AGGRESSIVE_TEXT_MINING
+}
+
+# Page-side helpers shared by the SPA waiting and extraction strategies. Registered
+# once per browser context via add_init_script so later calls only send a function call.
+SPA_HELPERS_JS = (
+    "(() => {\n"
+    "if (window.__spaHelpers) { return; }\n"
+    "window.__spaHelpers = true;\n"
+    + _SPA_WAIT_HELPERS_JS
+    + "".join(f"window.{name} = {source};\n" for name, source in _EXTRACTION_HELPERS.items())
+    + "})()\n"
+)
@@ -9,15 +9,64 @@ Tests both modes on the same URLs to ensure parity.
 """
 
 import asyncio
-import json
-import requests
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import aiohttp
+import orjson
 
-def test_extraction_mode(url: str, mode: str, include_links: bool = False) -> Dict:
+
+class RateLimitPacer:
+    """Space out requests according to the X-RateLimit headers the API returns.
+    
+    Requests are not paced until the server has advertised a per-second limit,
+    so callers should let one response arrive before fanning out.
+    A 429 response pushes the next free slot back by its Retry-After value.
+    """
+    
+    def __init__(self) -> None:
+        self.interval = 0.0
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Wait for the next free request slot."""
+        async with self.lock:
+            now = time.monotonic()
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def update(self, response: aiohttp.ClientResponse) -> None:
+        """Adapt the pacing to the rate limit headers of a response."""
+        per_second = response.headers.get("X-RateLimit-Limit-Per-Second")
+        if per_second:
+            try:
+                self.interval = 1.0 / max(float(per_second), 0.001)
+            except ValueError:
+                pass
+        if response.status == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", "1"))
+            except ValueError:
+                retry_after = 1.0
+            self.next_slot = max(self.next_slot, time.monotonic() + retry_after)
+
+
+async def test_extraction_mode(
+    session: aiohttp.ClientSession,
+    url: str,
+    mode: str,
+    include_links: bool = False,
+    pacer: Optional[RateLimitPacer] = None
+) -> Dict:
     """Test extraction with specified mode and return detailed results."""
-    api_url = "http://127.0.0.1:8000/from-url"
+    # Only the metadata is needed, so skip the extracted text in the response
+    api_url = (
+        "http://127.0.0.1:8000/from-url"
+        "?fields=text_length,reason,final_url,proxy_used,links_count,mode,lang"
+    )
     
     payload = {
         "url": url,
@@ -28,35 +77,48 @@ def test_extraction_mode(url: str, mode: str, include_links: bool = False) -> Di
         "convert_files": False
     }
     
+    if pacer:
+        await pacer.wait()
+    
     start_time = time.time()
     
     try:
-        response = requests.post(api_url, json=payload, timeout=45)
+        async with session.post(
+            api_url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=45)
+        ) as response:
+            if pacer:
+                pacer.update(response)
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+            else:
+                error_text = await response.text()
         duration = time.time() - start_time
         
-        if response.status_code == 200:
-            data = response.json()
-            text_length = len(data.get("text", ""))
+        if response.status == 200:
+            text_length = data.get("text_length", 0)
             
             return {
                 "success": True,
-                "status_code": response.status_code,
+                "status_code": response.status,
                 "text_length": text_length,
                 "duration": round(duration, 2),
                 "reason": data.get("reason", "unknown"),
                 "final_url": data.get("final_url", url),
                 "proxy_used": data.get("proxy_used"),
-                "links_count": len(data.get("links", [])) if data.get("links") else 0,
+                "links_count": data.get("links_count", 0),
                 "mode": data.get("mode", mode),
                 "lang": data.get("lang", "unknown")
             }
         else:
             return {
                 "success": False,
-                "status_code": response.status_code,
+                "status_code": response.status,
                 "text_length": 0,
                 "duration": round(duration, 2),
-                "error": response.text[:200],
+                "error": error_text[:200],
                 "mode": mode
             }
             
@@ -72,17 +134,18 @@ def test_extraction_mode(url: str, mode: str, include_links: bool = False) -> Di
         }
 
 
-def compare_modes(url: str, include_links: bool = False) -> Dict:
+async def compare_modes(
+    session: aiohttp.ClientSession,
+    url: str,
+    include_links: bool = False,
+    pacer: Optional[RateLimitPacer] = None
+) -> Dict:
     """Compare simple and browser modes for the same URL."""
-    print(f"\n=== Testing URL: {url} ===")
-    
-    # Test simple mode
-    print("Testing Simple Mode...")
-    simple_result = test_extraction_mode(url, "simple", include_links)
-    
-    # Test browser mode
-    print("Testing Browser Mode...")
-    browser_result = test_extraction_mode(url, "browser", include_links)
+    # Test both modes concurrently
+    simple_result, browser_result = await asyncio.gather(
+        test_extraction_mode(session, url, "simple", include_links, pacer),
+        test_extraction_mode(session, url, "browser", include_links, pacer)
+    )
     
     # Compare results
     comparison = {
@@ -120,7 +183,8 @@ def compare_modes(url: str, include_links: bool = False) -> Dict:
         comparison["notes"].append("Both modes failed")
         comparison["parity_achieved"] = True  # Both failed equally
     
-    # Print results
+    # Print results (as one block, since URLs are tested concurrently)
+    print(f"\n=== Tested URL: {url} ===")
     print(f"Simple Mode:  {'SUCCESS' if simple_result['success'] else 'FAILED'} - {simple_result['text_length']} chars in {simple_result['duration']}s")
     print(f"Browser Mode: {'SUCCESS' if browser_result['success'] else 'FAILED'} - {browser_result['text_length']} chars in {browser_result['duration']}s")
     print(f"Parity: {'ACHIEVED' if comparison['parity_achieved'] else 'FAILED'} - {', '.join(comparison['notes'])}")
@@ -128,6 +192,41 @@ def compare_modes(url: str, include_links: bool = False) -> Dict:
     return comparison
 
 
+async def run_tests(test_urls: List[str]) -> List[Dict]:
+    """Test all URLs concurrently over one pooled HTTP session."""
+    pacer = RateLimitPacer()
+    
+    async def run_one(index: int, url: str):
+        try:
+            return index, await compare_modes(session, url, include_links=False, pacer=pacer)
+        except Exception as e:
+            print(f"Error testing {url}: {e}")
+            return index, {
+                "url": url,
+                "error": str(e),
+                "parity_achieved": False
+            }
+    
+    connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results: List[Optional[Dict]] = [None] * len(test_urls)
+        if not test_urls:
+            return results
+        
+        # Test the first URL on its own so the pacer learns the advertised
+        # rate limit before the remaining requests are launched concurrently
+        index, result = await run_one(0, test_urls[0])
+        results[index] = result
+        
+        # Report each URL as soon as it finishes instead of waiting for the slowest
+        remaining = [run_one(i, url) for i, url in enumerate(test_urls) if i > 0]
+        for finished in asyncio.as_completed(remaining):
+            index, result = await finished
+            results[index] = result
+    
+    return results
+
+
 def main():
     """Run comprehensive browser mode robustness tests."""
     print("Browser Mode Robustness Test")
@@ -143,21 +242,8 @@ def main():
         "https://github.com",  # Modern web app with some JS
     ]
     
-    results = []
-    
-    # Test each URL
-    for url in test_urls:
-        try:
-            result = compare_modes(url, include_links=False)
-            results.append(result)
-            time.sleep(2)  # Brief pause between tests
-        except Exception as e:
-            print(f"Error testing {url}: {e}")
-            results.append({
-                "url": url,
-                "error": str(e),
-                "parity_achieved": False
-            })
+    # Test all URLs and modes concurrently
+    results = asyncio.run(run_tests(test_urls))
     
     # Summary
     print("\n" + "=" * 50)
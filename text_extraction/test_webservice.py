@@ -0,0 +1,223 @@
+"""
+Web service behaviour tests.
+
+Exercises the result cache and revalidation, request coalescing, the
+/from-urls batch modes, `fields` projection and the error response with
+a stubbed content_extraction.extract_from_url, so no network or browser
+is needed.
+"""
+
+import asyncio
+import time
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import text_extraction.webservice as webservice
+
+URL = "https://example.org/lesson"
+
+
+def _result(url: str, text: str = "Extracted lesson text", **extra):
+    """Successful simple-mode extraction result as returned by content_extraction."""
+    return {
+        "text": text,
+        "status": 200,
+        "reason": "success",
+        "message": "Text extracted successfully",
+        "lang": "en",
+        "mode": "simple",
+        "final_url": url,
+        "converted": False,
+        "proxy_used": None,
+        "links": None,
+        "quality_metrics": None,
+        **extra
+    }
+
+
+class StubExtractor:
+    """Stand-in for content_extraction.extract_from_url that records its calls."""
+
+    def __init__(self, result=None, error=None, gate=None):
+        self.calls = []
+        self.result = result
+        self.error = error
+        self.gate = gate
+
+    async def __call__(self, url, **kwargs):
+        self.calls.append(url)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return dict(self.result) if self.result is not None else _result(url)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    webservice._RESULT_CACHE.clear()
+    webservice._inflight.clear()
+    yield
+    webservice._RESULT_CACHE.clear()
+    webservice._inflight.clear()
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    extractor = StubExtractor()
+    monkeypatch.setattr(webservice.content_extraction, "extract_from_url", extractor)
+    return extractor
+
+
+@pytest.fixture
+def client():
+    # No context manager: the lifespan (shared browser, process pools) is not started
+    return TestClient(webservice.app)
+
+
+def _expire_cache():
+    for key, (_, result) in list(webservice._RESULT_CACHE.items()):
+        webservice._RESULT_CACHE[key] = (time.monotonic() - webservice._RESULT_CACHE_TTL - 1, result)
+
+
+def test_repeated_request_is_served_from_cache(client, stub):
+    first = client.post("/from-url", json={"url": URL})
+    second = client.post("/from-url", json={"url": URL})
+
+    assert first.status_code == 200 and second.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json()["text"] == first.json()["text"]
+    assert second.json()["extraction_origin"] == "cache"
+    assert stub.calls == [URL]
+
+
+def test_cache_key_includes_proxies(client, stub):
+    client.post("/from-url", json={"url": URL, "proxies": ["10.0.0.1:8080"]})
+    response = client.post("/from-url", json={"url": URL, "proxies": ["10.0.0.2:8080"]})
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert len(stub.calls) == 2
+
+
+def test_expired_entry_is_revalidated(client, stub, monkeypatch):
+    stub.result = _result(URL, etag='"v1"')
+    client.post("/from-url", json={"url": URL})
+    _expire_cache()
+
+    revalidated = []
+    monkeypatch.setattr(
+        webservice.content_extraction,
+        "is_not_modified",
+        lambda url, etag, last_modified: revalidated.append((url, etag)) or True
+    )
+    response = client.post("/from-url", json={"url": URL})
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert revalidated == [(URL, '"v1"')]
+    assert stub.calls == [URL]
+
+
+def test_expired_entry_is_refetched_when_modified(client, stub, monkeypatch):
+    stub.result = _result(URL, etag='"v1"')
+    client.post("/from-url", json={"url": URL})
+    _expire_cache()
+
+    monkeypatch.setattr(webservice.content_extraction, "is_not_modified", lambda *args: False)
+    response = client.post("/from-url", json={"url": URL})
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert stub.calls == [URL, URL]
+
+
+def test_extraction_error_returns_http_500(client, stub):
+    stub.error = RuntimeError("connection reset")
+    response = client.post("/from-url", json={"url": URL})
+
+    assert response.status_code == 500
+    body = response.json()
+    assert body["reason"] == "extraction_error"
+    assert "connection reset" in body["message"]
+    assert URL not in [key[0] for key in webservice._RESULT_CACHE]
+
+
+def test_fields_projection(client, stub):
+    response = client.post("/from-url?fields=text_length,reason,links_count", json={"url": URL})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "text_length": len("Extracted lesson text"),
+        "reason": "success",
+        "links_count": 0
+    }
+
+
+def test_unknown_field_is_rejected(client, stub):
+    response = client.post("/from-url?fields=text,bogus", json={"url": URL})
+
+    assert response.status_code == 400
+    assert stub.calls == []
+
+
+def test_batch_join_all_returns_results_in_order(client, stub):
+    urls = [f"{URL}/{i}" for i in range(3)]
+    response = client.post("/from-urls", json={"mode": "join_all", "items": [{"url": url} for url in urls]})
+
+    assert response.status_code == 200
+    entries = response.json()
+    assert [entry["index"] for entry in entries] == [0, 1, 2]
+    assert [entry["result"]["final_url"] for entry in entries] == urls
+
+
+def test_batch_select_all_streams_ndjson(client, stub):
+    urls = [f"{URL}/{i}" for i in range(3)]
+    response = client.post("/from-urls", json={"items": [{"url": url} for url in urls]})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    entries = [orjson.loads(line) for line in response.text.splitlines() if line]
+    assert sorted(entry["index"] for entry in entries) == [0, 1, 2]
+    assert {entry["result"]["final_url"] for entry in entries} == set(urls)
+
+
+def test_identical_concurrent_requests_are_coalesced(stub):
+    async def scenario():
+        stub.gate = asyncio.Event()
+        transport = httpx.ASGITransport(app=webservice.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            requests = [asyncio.create_task(http.post("/from-url", json={"url": URL})) for _ in range(3)]
+            while not stub.calls:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            stub.gate.set()
+            return await asyncio.gather(*requests)
+
+    responses = asyncio.run(scenario())
+
+    assert stub.calls == [URL]
+    assert all(response.status_code == 200 for response in responses)
+    assert sum(response.headers.get("X-Coalesced") == "1" for response in responses) == 2
+
+
+def test_cancelled_leader_does_not_fail_coalesced_requests(stub):
+    async def scenario():
+        stub.gate = asyncio.Event()
+        data = webservice.ExtractionData(url=URL)
+        leader = asyncio.create_task(webservice._extract_result(data, webservice.Response()))
+        while not stub.calls:
+            await asyncio.sleep(0.01)
+        follower = asyncio.create_task(webservice._extract_result(data, webservice.Response()))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        stub.gate.set()
+        return await follower
+
+    result = asyncio.run(scenario())
+
+    assert isinstance(result, webservice.ExtractionResult)
+    assert result.reason == "success"
+    assert stub.calls == [URL]
@@ -0,0 +1,43 @@
+"""
+Timestamp helpers shared by the extraction modules and the web service.
+
+``extraction_timestamp`` is documented as the ISO 8601 time of extraction,
+not as a sub-second ordering key, so hot paths can reuse a recently
+formatted string instead of building a new datetime per request.
+"""
+
+import time
+from datetime import datetime, timezone
+
+UTC = timezone.utc
+
+# Maximum age in seconds of the cached timestamp string
+_CACHE_RESOLUTION = 0.5
+
+
+class _TsCache:
+    """Last formatted timestamp and the monotonic time it was taken at."""
+    __slots__ = ("t", "s")
+    
+    def __init__(self):
+        self.t = float("-inf")
+        self.s = ""
+
+
+_cache = _TsCache()
+
+
+def iso_now_cached() -> str:
+    """
+    Current UTC time as an ISO 8601 string, reformatted at most every 0.5s.
+    
+    Returns:
+        ISO 8601 timestamp that is at most ``_CACHE_RESOLUTION`` seconds old
+    """
+    # Age is tracked on the monotonic clock, so a wall clock stepped back
+    # (e.g. by NTP) cannot freeze the cached string
+    now = time.monotonic()
+    if now - _cache.t > _CACHE_RESOLUTION:
+        _cache.t = now
+        _cache.s = datetime.fromtimestamp(time.time(), tz=UTC).isoformat()
+    return _cache.s
@@ -10,23 +10,36 @@ from the original codebase while incorporating all recent improvements.
 
 import argparse
 import asyncio
+import atexit
+import importlib.util
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import re
 import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from enum import StrEnum, auto
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from playwright import async_api
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Import modules - with fallback to basic implementation
 try:
     import text_extraction.content_extraction as content_extraction
     import text_extraction.browser_helpers as browser_helpers
+    import text_extraction.markitdown_converter as markitdown_converter
     ENHANCED_MODULES_AVAILABLE = True
 except ImportError:
     # Fallback to basic implementation if enhanced modules don't exist yet
@@ -34,34 +47,139 @@ except ImportError:
     ENHANCED_MODULES_AVAILABLE = False
 
 from text_extraction._version import __version__
+from text_extraction.timestamps import iso_now_cached
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Route log records through a queue to a background listener thread.
+    
+    Request coroutines only enqueue records; the listener owns the stream
+    handler, so a slow stdout/stderr never blocks the event loop.
+    
+    Args:
+        level: Root logger level
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# uvicorn's loggers drop their own stream handlers and propagate to the queued root
+UVICORN_LOG_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "loggers": {
+        name: {"handlers": [], "propagate": True}
+        for name in ("uvicorn", "uvicorn.error", "uvicorn.access")
+    },
+}
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Ways users indicate "no proxy" (compared lowercased) and the accepted host:port format
+_NO_PROXY = frozenset({"", "string", "none", "null", "false", "0"})
+_PROXY_RE = re.compile(r"^[^\s:]+:\d{1,5}$")
+
+
+class _RespawningProcessPool(Executor):
+    """
+    Process pool that replaces itself once a worker has died.
+    
+    A worker killed by the OOM killer or a segfault leaves a ProcessPoolExecutor
+    permanently broken: every later submit raises BrokenProcessPool. The task
+    that was running when the worker died still fails (callers fall back to
+    inline parsing), but the next submit starts a fresh pool.
+    """
+    
+    def __init__(self, **pool_kwargs: Any):
+        self._pool_kwargs = pool_kwargs
+        self._pool = ProcessPoolExecutor(**pool_kwargs)
+    
+    def submit(self, fn, /, *args, **kwargs):
+        try:
+            return self._pool.submit(fn, *args, **kwargs)
+        except BrokenProcessPool as e:
+            logger.warning("CPU process pool broken, starting a new one: %s", e)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = ProcessPoolExecutor(**self._pool_kwargs)
+            return self._pool.submit(fn, *args, **kwargs)
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for FastAPI application."""
     # Startup
-    logger.info(f"Starting Text Extraction API - Smart v{__version__}")
+    logger.info("Starting Text Extraction API - Smart v%s", __version__)
     if ENHANCED_MODULES_AVAILABLE:
         logger.info("Enhanced modules available: File conversion, Proxy rotation, Link extraction, Quality metrics")
     else:
         logger.info("Basic mode: Enhanced modules not available, using fallback implementation")
     
+    # Launch the shared browser once; each request gets its own context
+    if ENHANCED_MODULES_AVAILABLE:
+        try:
+            await get_shared_browser()
+        except Exception as e:
+            logger.warning("Shared browser could not be launched at startup: %s", e)
+    
+    # Process pool for CPU-bound HTML parsing, so trafilatura does not hold the
+    # GIL on the event loop thread (CPU_POOL_WORKERS, 0 disables). The pool is
+    # per uvicorn worker process, so the default stays small
+    cpu_pool_workers = int(os.getenv("CPU_POOL_WORKERS", "2"))
+    app.state.cpu_pool = _RespawningProcessPool(
+        max_workers=cpu_pool_workers,
+        # The service already runs threads (log listener, Playwright driver),
+        # so workers start from a fresh interpreter instead of a fork; they
+        # get their own stderr handler as they do not inherit the log queue
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=partial(logging.basicConfig, level=logging.INFO, format=logging.BASIC_FORMAT)
+    ) if cpu_pool_workers > 0 else None
+    
+    # Pre-spawn the file conversion workers so MarkItDown is already imported
+    # when the first document arrives (MARKITDOWN_POOL_WORKERS, 0 disables)
+    if ENHANCED_MODULES_AVAILABLE:
+        try:
+            markitdown_converter.start_conversion_pool()
+        except Exception as e:
+            logger.warning("File conversion pool could not be started: %s", e)
+    
     yield
     
     # Shutdown
     global browser_instance, playwright_instance
     
+    # Stop the parsing process pool
+    if app.state.cpu_pool is not None:
+        app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("CPU process pool shut down")
+    
+    # Stop the file conversion workers
+    if ENHANCED_MODULES_AVAILABLE:
+        markitdown_converter.shutdown_conversion_pool()
+    
     # Close browser instance
     if browser_instance:
         try:
             await browser_instance.close()
             logger.info("Browser instance closed")
         except Exception as e:
-            logger.warning(f"Error closing browser: {e}")
+            logger.warning("Error closing browser: %s", e)
     
     # Stop playwright instance
     if playwright_instance:
@@ -69,7 +187,7 @@ async def lifespan(app: FastAPI):
             await playwright_instance.stop()
             logger.info("Playwright instance stopped")
         except Exception as e:
-            logger.warning(f"Error stopping playwright: {e}")
+            logger.warning("Error stopping playwright: %s", e)
     
     logger.info("Text Extraction API - Smart shutdown complete")
 
@@ -90,6 +208,7 @@ app = FastAPI(
 
 **Main Endpoints:**
 - `POST /extract` - Extract text from URLs with full feature support
+- `POST /from-urls` - Batch extraction with streamed (NDJSON) or joined results
 - `GET /health` - Health check endpoint
 - `GET /docs` - Interactive API documentation (this page)
 - `GET /redoc` - Alternative API documentation
@@ -109,21 +228,82 @@ When enabled, returns normalized scores (0-1) for:
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware for cross-origin requests
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS is fully wildcarded, so a fixed header set replaces CORSMiddleware's
+# per-request origin/method/header matching
+_CORS_STATIC = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+_CORS_RAW_HEADERS = [(name.lower().encode(), value.encode()) for name, value in _CORS_STATIC.items()]
+
+
+class StaticCORSMiddleware:
+    """
+    Pure ASGI middleware adding the static CORS headers to every response.
+    
+    Only real preflights (OPTIONS with Origin and Access-Control-Request-Method)
+    are answered directly; other OPTIONS requests reach the application.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS":
+            header_names = {name for name, _ in scope["headers"]}
+            if b"origin" in header_names and b"access-control-request-method" in header_names:
+                await send({"type": "http.response.start", "status": 204, "headers": _CORS_RAW_HEADERS})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_CORS_RAW_HEADERS]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(StaticCORSMiddleware)
 
 # Global browser and playwright instances for reuse
 playwright_instance: Optional[Any] = None
 browser_instance: Optional[async_api.Browser] = None
+_browser_lock = asyncio.Lock()
+
+# Bounds on concurrent extractions: each browser context costs ~100MB of RAM,
+# so further browser requests queue instead of thrashing the host. Like the
+# result cache below, the limits are per process (multiply by --workers).
+MAX_CONCURRENT_BROWSER = int(os.getenv("MAX_CONCURRENT_BROWSER", "4"))
+MAX_CONCURRENT_SIMPLE = int(os.getenv("MAX_CONCURRENT_SIMPLE", "32"))
+BROWSER_SEM = asyncio.Semaphore(MAX_CONCURRENT_BROWSER)
+SIMPLE_SEM = asyncio.Semaphore(MAX_CONCURRENT_SIMPLE)
+_in_flight = {"browser": 0, "simple": 0}
+
+# Worst-case page-side time of one browser attempt after navigation, in seconds:
+# SPA/ultra-complex waits, the educational content wait and the extraction
+# strategies (spa_extraction.py). Used to derive the hard extraction deadline.
+BROWSER_PAGE_BUDGET = int(os.getenv("BROWSER_PAGE_BUDGET", "150"))
+
+# In-process LRU cache of successful extraction results. Entries are served for
+# EXTRACTION_CACHE_TTL seconds (0 disables caching); after that, entries with
+# ETag/Last-Modified validators are revalidated with a conditional GET.
+_RESULT_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", "300"))
+_RESULT_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_SIZE", "1024"))
+_RESULT_CACHE: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Extractions currently running, keyed like the result cache. Identical
+# concurrent requests await the running extraction instead of starting another.
+_inflight: Dict[Tuple, asyncio.Task] = {}
 
 
 class ExtractionMethod(StrEnum):
@@ -180,6 +360,8 @@ class QualityMetrics(BaseModel):
 
 class ExtractionData(BaseModel):
     """Request data model for text extraction"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=False, validate_assignment=False)
+    
     url: str = Field(..., description="URL to extract text from")
     method: ExtractionMethod = Field(default=ExtractionMethod.simple, description="Extraction method")
     output_format: OutputFormat = Field(default=OutputFormat.markdown, description="Output format")
@@ -215,60 +397,22 @@ class ExtractionData(BaseModel):
         if isinstance(v, str):
             v = [v]
         
-        # Handle empty list
-        if not v or v == []:
-            return None
+        # Filter out empty/whitespace strings and "no proxy" indicators
+        proxies = [str(proxy).strip() for proxy in v if proxy is not None]
+        proxies = [proxy for proxy in proxies if proxy.lower() not in _NO_PROXY]
         
-        # Handle "no proxy" cases - various ways users might indicate no proxy
-        if isinstance(v, list):
-            # Check for common "no proxy" indicators
-            no_proxy_indicators = [
-                "",           # Empty string
-                "string",     # Literal "string" 
-                "none",       # "none"
-                "null",       # "null"
-                "false",      # "false"
-                "0",          # "0"
-            ]
-            
-            # Filter out empty/whitespace strings and no-proxy indicators
-            filtered_proxies = []
-            for proxy in v:
-                if proxy is None:
-                    continue
-                proxy_str = str(proxy).strip().lower()
-                if proxy_str and proxy_str not in no_proxy_indicators:
-                    filtered_proxies.append(str(proxy).strip())
-            
-            # If no valid proxies remain, return None
-            if not filtered_proxies:
-                return None
-            
-            # Validate remaining proxy entries
-            valid_proxies = []
-            for proxy in filtered_proxies:
-                if ':' not in proxy:
-                    raise ValueError(f"Invalid proxy format: {proxy}. Expected 'host:port'")
-                # Basic validation of host:port format
-                try:
-                    host, port = proxy.split(':', 1)
-                    if not host.strip() or not port.strip():
-                        raise ValueError(f"Invalid proxy format: {proxy}. Host and port cannot be empty")
-                    # Try to convert port to int to validate it's numeric
-                    int(port)
-                    valid_proxies.append(proxy)
-                except ValueError as e:
-                    if "Invalid proxy format" in str(e):
-                        raise e
-                    raise ValueError(f"Invalid proxy format: {proxy}. Port must be numeric")
-            
-            return valid_proxies if valid_proxies else None
+        # Validate remaining proxy entries
+        for proxy in proxies:
+            if not _PROXY_RE.match(proxy):
+                raise ValueError(f"Invalid proxy format: {proxy}. Expected 'host:port' with a numeric port")
         
-        return None
+        return proxies or None
 
 
 class ExtractionResult(BaseModel):
     """Response model for text extraction results"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=False, validate_assignment=False)
+    
     # Core content
     text: str = Field(..., description="Extracted text content")
     
@@ -305,6 +449,87 @@ class ExtractionResult(BaseModel):
     extraction_origin: Optional[str] = Field(default=None, description="Origin of extraction (realtime_crawl, backfill, cache, etc.)")
 
 
+def _result_cache_key(data: ExtractionData) -> Tuple:
+    """Cache key covering every request option that changes the extracted result."""
+    return (
+        data.url,
+        data.method,
+        data.output_format,
+        data.include_links,
+        data.preference,
+        data.target_language,
+        data.convert_files,
+        data.calculate_quality,
+        # Proxy order is randomized per request, so only the set matters
+        tuple(sorted(data.proxies)) if data.proxies else None
+    )
+
+
+async def _get_cached_result(key: Tuple) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached extraction result.
+    
+    Expired entries are revalidated against the origin when they carry
+    ETag/Last-Modified validators; a 304 refreshes the entry without
+    re-extracting. Otherwise they are dropped.
+    
+    Returns:
+        Optional[Dict[str, Any]]: Copy of the cached result, or None on a miss
+    """
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    
+    stored_at, result = entry
+    if time.monotonic() - stored_at > _RESULT_CACHE_TTL:
+        etag = result.get("etag")
+        last_modified = result.get("last_modified")
+        not_modified = bool(etag or last_modified) and ENHANCED_MODULES_AVAILABLE and await asyncio.to_thread(
+            content_extraction.is_not_modified, result["final_url"], etag, last_modified
+        )
+        if not not_modified:
+            _RESULT_CACHE.pop(key, None)
+            return None
+        logger.debug("Cache entry revalidated for %s", result['final_url'])
+        _RESULT_CACHE[key] = (time.monotonic(), result)
+    
+    if key in _RESULT_CACHE:
+        _RESULT_CACHE.move_to_end(key)
+    return dict(result)
+
+
+def _store_cached_result(key: Tuple, result: Dict[str, Any]) -> None:
+    """Cache a successful extraction result, evicting the least recently used entries."""
+    if _RESULT_CACHE_TTL <= 0 or result.get("reason") != "success" or not result.get("text"):
+        return
+    
+    _RESULT_CACHE[key] = (time.monotonic(), dict(result))
+    _RESULT_CACHE.move_to_end(key)
+    while len(_RESULT_CACHE) > _RESULT_CACHE_MAX_ENTRIES:
+        _RESULT_CACHE.popitem(last=False)
+
+
+# Validator for building results from the extractor dicts
+_RESULT_ADAPTER = TypeAdapter(ExtractionResult)
+
+# Serialized ExtractionResult skeleton for failed extractions
+_ERROR_TEMPLATE: Dict[str, Any] = {
+    "text": "",
+    "status": 500,
+    "reason": "extraction_error",
+    "message": "",
+    "lang": "unknown",
+    "version": __version__,
+    "converted": False,
+    "original_format": None,
+    "file_size_mb": None,
+    "proxy_used": None,
+    "links": None,
+    "quality_metrics": None,
+    "extraction_origin": "realtime_crawl_error"  # This is a failed extraction attempt
+}
+
+
 @app.get("/_ping")
 @app.get("/health")
 async def health_check():
@@ -314,6 +539,12 @@ async def health_check():
         "version": __version__, 
         "timestamp": time.time(),
         "enhanced_modules_available": ENHANCED_MODULES_AVAILABLE,
+        "in_flight": {
+            "browser": _in_flight["browser"],
+            "browser_limit": MAX_CONCURRENT_BROWSER,
+            "simple": _in_flight["simple"],
+            "simple_limit": MAX_CONCURRENT_SIMPLE
+        },
         "features": [
             "file_conversion",
             "proxy_rotation", 
@@ -344,25 +575,95 @@ async def health_check():
     - Link extraction with internal/external classification [if enhanced modules available]
     - Content quality metrics and assessment [if enhanced modules available]
     - Robust error handling with graceful fallbacks
+    
+    Use the `fields` query parameter (e.g. `?fields=text_length,reason,lang`) to
+    receive only selected result fields; `text_length` and `links_count` are
+    available as computed fields so callers can skip the text body entirely.
     """
 )
-async def extract_from_url(data: ExtractionData, response: Response) -> ExtractionResult:
+async def extract_from_url(
+    data: ExtractionData,
+    response: Response,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (also text_length, links_count)"
+    )
+) -> Union[ExtractionResult, ORJSONResponse]:
     """Extract text content from a URL with comprehensive feature support."""
-    start_time = time.time()
+    selected_fields = _parse_result_fields(fields)
+    result = await _extract_result(data, response)
+    if isinstance(result, dict):
+        return ORJSONResponse(result, status_code=500, headers=dict(response.headers))
+    if selected_fields is None:
+        return result
+    return ORJSONResponse(_select_result_fields(result, selected_fields), headers=dict(response.headers))
+
+
+# Computed fields available through the `fields` query parameter
+_COMPUTED_RESULT_FIELDS = {
+    "text_length": lambda result: len(result.text),
+    "links_count": lambda result: len(result.links) if result.links else 0,
+}
+
+
+def _parse_result_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse and validate the `fields` query parameter."""
+    if not fields:
+        return None
+    
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [
+        field for field in selected
+        if field not in ExtractionResult.model_fields and field not in _COMPUTED_RESULT_FIELDS
+    ]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown result fields: {', '.join(unknown)}")
+    return selected
+
+
+def _select_result_fields(result: ExtractionResult, selected_fields: List[str]) -> Dict[str, Any]:
+    """Project an extraction result onto the selected (and computed) fields."""
+    model_fields = [field for field in selected_fields if field in ExtractionResult.model_fields]
+    selected = result.model_dump(mode="json", include=set(model_fields))
+    for field in selected_fields:
+        if field in _COMPUTED_RESULT_FIELDS:
+            selected[field] = _COMPUTED_RESULT_FIELDS[field](result)
+    return selected
+
+
+async def _extract_result(data: ExtractionData, response: Response) -> Union[ExtractionResult, Dict[str, Any]]:
+    """Run (or serve from cache) one extraction and build its result.
+    
+    Returns:
+        The validated result, or the plain error payload if extraction failed
+    """
+    start_ns = time.perf_counter_ns()
     
     try:
-        logger.info(f"Starting extraction for URL: {data.url}")
+        logger.info("Starting extraction for URL: %s", data.url)
         
-        if ENHANCED_MODULES_AVAILABLE:
-            # Use enhanced modules if available
-            result = await enhanced_extraction(data)
-        else:
-            # Fallback to basic implementation
-            logger.info("Using basic implementation (enhanced modules not available)")
-            result = await basic_extraction_fallback(data)
+        cache_key = _result_cache_key(data)
+        cached_result = await _get_cached_result(cache_key) if _RESULT_CACHE_TTL > 0 else None
         
-        # Calculate extraction time
-        extraction_time = time.time() - start_time
+        if cached_result is not None:
+            logger.info("Serving cached result for URL: %s", data.url)
+            response.headers["X-Cache"] = "HIT"
+            result = cached_result
+            result["extraction_origin"] = "cache"
+        else:
+            response.headers["X-Cache"] = "MISS"
+            extraction = _inflight.get(cache_key)
+            if extraction is not None:
+                # An identical extraction is already running: share its result
+                logger.info("Coalescing with in-flight extraction for URL: %s", data.url)
+                response.headers["X-Coalesced"] = "1"
+            else:
+                extraction = _start_coalesced_extraction(data, cache_key)
+            # Shielded, so a disconnecting client only stops waiting and the
+            # extraction keeps running for the other requests sharing it
+            result = await asyncio.shield(extraction)
+            if isinstance(result, dict):
+                result = dict(result)
         
         # Add rate limit headers for transparency
         response.headers["X-RateLimit-Limit-Per-Minute"] = "45"
@@ -371,91 +672,271 @@ async def extract_from_url(data: ExtractionData, response: Response) -> Extracti
         response.headers["X-RateLimit-Policy"] = "sliding-window"
         response.headers["X-API-Version"] = __version__
         
-        # Ensure result has extraction_time
-        if isinstance(result, dict):
-            result['extraction_time'] = extraction_time
-            result['version'] = __version__
-            return ExtractionResult(**result)
-        else:
+        if not isinstance(result, dict):
             # Handle unexpected result format
-            # Generate timestamp and origin for unexpected format case
-            extraction_timestamp = datetime.now(timezone.utc).isoformat()
-            extraction_origin = "realtime_crawl_fallback"  # This is a fallback format handling
-            
-            return ExtractionResult(
-                text=result if isinstance(result, str) else "",
-                status=200,
-                reason="success",
-                message="Extraction completed",
-                lang="auto",
-                mode=data.method.value,
-                final_url=data.url,
-                extraction_time=extraction_time,
-                extraction_timestamp=extraction_timestamp,
-                extraction_origin=extraction_origin
-            )
+            result = {
+                "text": result if isinstance(result, str) else "",
+                "status": 200,
+                "reason": "success",
+                "message": "Extraction completed",
+                "lang": "auto",
+                "mode": data.method,
+                "final_url": data.url,
+                "extraction_origin": "realtime_crawl_fallback"  # This is a fallback format handling
+            }
+        
+        return _finalize_result(result, start_ns)
             
     except Exception as e:
-        extraction_time = time.time() - start_time
-        logger.error(f"Extraction failed for {data.url}: {str(e)}")
+        logger.error("Extraction failed for %s: %s", data.url, e)
         
-        # Generate timestamp and origin for error case
-        extraction_timestamp = datetime.now(timezone.utc).isoformat()
-        extraction_origin = "realtime_crawl_error"  # This is a failed extraction attempt
+        # Plain dict payload: no model validation on the error path
+        return _error_payload(data, f"Extraction failed: {str(e)}", start_ns)
+
+
+def _error_payload(data: ExtractionData, message: str, start_ns: int, **overrides: Any) -> Dict[str, Any]:
+    """Fill the error skeleton for a failed extraction of ``data``."""
+    return {
+        **_ERROR_TEMPLATE,
+        "message": message,
+        "mode": data.method,
+        "final_url": data.url,
+        "extraction_time": (time.perf_counter_ns() - start_ns) / 1e9,
+        "extraction_timestamp": iso_now_cached(),
+        **overrides
+    }
+
+
+def _start_coalesced_extraction(data: ExtractionData, cache_key: Tuple) -> asyncio.Task:
+    """Start an extraction as a task that concurrent identical requests can share.
+    
+    The task is not owned by the request that started it, so cancelling that
+    request does not fail the others awaiting it. The check-and-insert on
+    ``_inflight`` happens without an intervening await, so it is atomic on the
+    event loop and needs no lock.
+    """
+    async def run() -> Any:
+        if ENHANCED_MODULES_AVAILABLE:
+            # Use enhanced modules if available
+            result = await enhanced_extraction(data)
+        else:
+            # Fallback to basic implementation
+            logger.info("Using basic implementation (enhanced modules not available)")
+            result = await basic_extraction_fallback(data)
         
-        return ExtractionResult(
-            text="",
-            status=500,
-            reason="extraction_error",
-            message=f"Extraction failed: {str(e)}",
-            lang="unknown",
-            mode=data.method.value,
-            final_url=data.url,
-            extraction_time=extraction_time,
-            extraction_timestamp=extraction_timestamp,
-            extraction_origin=extraction_origin
-        )
+        if isinstance(result, dict):
+            _store_cached_result(cache_key, result)
+        return result
+    
+    def done(task: asyncio.Task) -> None:
+        if _inflight.get(cache_key) is task:
+            del _inflight[cache_key]
+        # Mark the outcome as retrieved even if no request ended up waiting on it
+        if not task.cancelled():
+            task.exception()
+    
+    task = asyncio.create_task(run())
+    task.add_done_callback(done)
+    _inflight[cache_key] = task
+    return task
+
+
+def _finalize_result(result: Dict[str, Any], start_ns: int) -> ExtractionResult:
+    """Stamp timing, version and (if missing) the extraction timestamp onto a result."""
+    result['extraction_time'] = (time.perf_counter_ns() - start_ns) / 1e9
+    result['version'] = __version__
+    if not result.get('extraction_timestamp'):
+        result['extraction_timestamp'] = iso_now_cached()
+    return _RESULT_ADAPTER.validate_python(result)
+
+
+class ExtractionBatch(BaseModel):
+    """Request data model for batch text extraction"""
+    items: List[ExtractionData] = Field(..., min_length=1, max_length=100, description="Extraction requests")
+    mode: Literal["select_all", "join_all"] = Field(
+        default="select_all",
+        description="select_all streams NDJSON results as they complete; join_all returns all results at once"
+    )
+    total_timeout: float = Field(default=120, gt=0, le=600, description="Timeout for the whole batch in seconds")
+
+
+async def _batch_item(index: int, item: ExtractionData) -> Dict[str, Any]:
+    """Run one batch item and wrap its result with the item index."""
+    result = await _extract_result(item, Response())
+    if isinstance(result, ExtractionResult):
+        result = result.model_dump(mode="json")
+    return {"index": index, "result": result}
+
+
+def _batch_timeout_item(index: int, item: ExtractionData, start_ns: int) -> Dict[str, Any]:
+    """Result entry for a batch item that did not finish within the batch timeout."""
+    result = _error_payload(
+        item,
+        "Batch timeout exceeded",
+        start_ns,
+        status=504,
+        reason="batch_timeout"
+    )
+    return {"index": index, "result": result}
+
+
+@app.post(
+    "/from-urls",
+    summary="Extract text from multiple URLs",
+    description="""
+    Extract text from a batch of URLs in one request. Items run concurrently and
+    share the service-wide concurrency limits of `/from-url`.
+    
+    - `select_all` (default): streams one NDJSON line `{"index": ..., "result": ...}`
+      per item as soon as it completes
+    - `join_all`: returns a JSON list of all results in request order
+    
+    Items still running when `total_timeout` expires are cancelled and reported
+    with reason `batch_timeout`.
+    """
+)
+async def extract_from_urls(batch: ExtractionBatch):
+    """Extract text content from multiple URLs concurrently."""
+    start_ns = time.perf_counter_ns()
+    tasks = [asyncio.create_task(_batch_item(i, item)) for i, item in enumerate(batch.items)]
+    
+    if batch.mode == "join_all":
+        done, pending = await asyncio.wait(tasks, timeout=batch.total_timeout)
+        for task in pending:
+            task.cancel()
+        results = [
+            task.result() if task in done else _batch_timeout_item(i, batch.items[i], start_ns)
+            for i, task in enumerate(tasks)
+        ]
+        return ORJSONResponse(results)
+    
+    async def stream_results():
+        reported = set()
+        try:
+            for finished in asyncio.as_completed(tasks, timeout=batch.total_timeout):
+                entry = await finished
+                reported.add(entry["index"])
+                yield orjson.dumps(entry) + b"\n"
+        except asyncio.TimeoutError:
+            for i, item in enumerate(batch.items):
+                if i not in reported:
+                    yield orjson.dumps(_batch_timeout_item(i, item, start_ns)) + b"\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+@asynccontextmanager
+async def extraction_slot(method: str):
+    """Hold a concurrency slot for one extraction of the given method."""
+    semaphore = BROWSER_SEM if method == ExtractionMethod.browser else SIMPLE_SEM
+    async with semaphore:
+        _in_flight[method] += 1
+        try:
+            yield
+        finally:
+            _in_flight[method] -= 1
 
 
 async def enhanced_extraction(data: ExtractionData) -> Dict[str, Any]:
     """Enhanced extraction using full feature modules."""
+    # StrEnum members are plain strings, so they are passed on as-is
+    method, output_format, preference = data.method, data.output_format, data.preference
+    
     # Determine extraction method
-    if data.method == ExtractionMethod.browser:
-        # Use fresh browser strategy - no browser instance passed
-        # browser_helpers will create its own fresh instance
-        result = await browser_helpers.extract_with_browser(
-            url=data.url,
-            browser=None,  # Force fresh browser creation
-            output_format=data.output_format.value,
-            target_language=data.target_language,
-            preference=data.preference.value,
-            convert_files=data.convert_files,
-            max_file_size_mb=data.max_file_size_mb,
-            conversion_timeout=data.conversion_timeout,
-            include_links=data.include_links,
-            proxies=data.proxies,
-            timeout=data.timeout,
-            calculate_quality=data.calculate_quality
-        )
+    if method == ExtractionMethod.browser:
+        async with extraction_slot(ExtractionMethod.browser):
+            # Use the shared browser; browser_helpers falls back to a fresh
+            # instance if it cannot be (re)launched
+            try:
+                browser = await get_shared_browser()
+            except Exception as e:
+                logger.error("Shared browser unavailable: %s", e)
+                browser = None
+            extraction = browser_helpers.extract_with_browser(
+                url=data.url,
+                browser=browser,
+                output_format=output_format,
+                target_language=data.target_language,
+                preference=preference,
+                convert_files=data.convert_files,
+                max_file_size_mb=data.max_file_size_mb,
+                conversion_timeout=data.conversion_timeout,
+                include_links=data.include_links,
+                proxies=data.proxies,
+                timeout=data.timeout,
+                calculate_quality=data.calculate_quality
+            )
+            result = await _with_extraction_timeout(extraction, data)
     else:
-        # Use simple extraction
-        result = await content_extraction.extract_from_url(
-            url=data.url,
-            output_format=data.output_format.value,
-            target_language=data.target_language,
-            preference=data.preference.value,
-            convert_files=data.convert_files,
-            max_file_size_mb=data.max_file_size_mb,
-            conversion_timeout=data.conversion_timeout,
-            include_links=data.include_links,
-            proxies=data.proxies,
-            timeout=data.timeout,
-            calculate_quality=data.calculate_quality
-        )
+        async with extraction_slot(ExtractionMethod.simple):
+            # Use simple extraction
+            extraction = content_extraction.extract_from_url(
+                url=data.url,
+                output_format=output_format,
+                target_language=data.target_language,
+                preference=preference,
+                convert_files=data.convert_files,
+                max_file_size_mb=data.max_file_size_mb,
+                conversion_timeout=data.conversion_timeout,
+                include_links=data.include_links,
+                proxies=data.proxies,
+                timeout=data.timeout,
+                calculate_quality=data.calculate_quality,
+                executor=getattr(app.state, "cpu_pool", None)
+            )
+            result = await _with_extraction_timeout(extraction, data)
     
     return result
 
 
+def _extraction_deadline(data: ExtractionData) -> float:
+    """
+    Hard deadline in seconds for one extraction, derived from the inner budgets.
+    
+    The deadline must not undercut the waits the extractors already make,
+    otherwise slow pages that would still succeed are cut off with a 504.
+    """
+    attempts = len(data.proxies or [])
+    conversion = data.conversion_timeout if data.convert_files else 0
+    if data.method == ExtractionMethod.browser:
+        # domcontentloaded navigation plus the networkidle retry (browser_helpers)
+        navigation = max(60, data.timeout) + max(90, data.timeout * 1.5)
+        budget = max(attempts, 1) * (navigation + BROWSER_PAGE_BUDGET) + conversion
+    else:
+        # HEAD probe and download for file conversion, then one GET per proxy
+        # plus the direct connection
+        file_probe = 10 + data.timeout + conversion if data.convert_files else 0
+        budget = file_probe + (attempts + 1) * data.timeout
+    return budget + 5
+
+
+async def _with_extraction_timeout(extraction, data: ExtractionData) -> Dict[str, Any]:
+    """
+    Await an extraction with a hard deadline.
+    
+    The request timeout only bounds individual network operations, so a hung
+    browser could otherwise hold its concurrency slot indefinitely. The deadline
+    covers the worst case of the inner timeouts plus a small grace period.
+    """
+    deadline = _extraction_deadline(data)
+    try:
+        return await asyncio.wait_for(extraction, timeout=deadline)
+    except asyncio.TimeoutError:
+        logger.warning("Extraction timed out after %ss for %s", deadline, data.url)
+        return {
+            **_ERROR_TEMPLATE,
+            "status": 504,
+            "reason": "extraction_timeout",
+            "message": f"Extraction exceeded the {deadline}s time limit",
+            "mode": data.method,
+            "final_url": data.url,
+            "links": [] if data.include_links else None
+        }
+
+
 async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
     """Fallback to basic extraction when enhanced modules are not available."""
     lang = data.target_language
@@ -464,15 +945,27 @@ async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
     if data.method == ExtractionMethod.simple:
         text = grab_content.from_html(
             data.url,
-            preference=data.preference.value,
+            preference=data.preference,
             target_language=lang,
         )
     else:
         # Browser mode fallback
         if data.browser_location is None:
-            get_browser_fun = lambda x: x.chromium.launch(
-                args=["--single-process"]
-            )
+            # --single-process serializes rendering onto one core; only use it
+            # where the container requires it (PLAYWRIGHT_SINGLE_PROCESS=1)
+            if os.getenv("PLAYWRIGHT_SINGLE_PROCESS", "0") == "1":
+                launch_args = ["--single-process"]
+            else:
+                launch_args = [
+                    "--no-sandbox",
+                    "--disable-dev-shm-usage",
+                    "--disable-gpu",
+                    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+                    "--disable-extensions",
+                    "--disable-sync",
+                    "--no-first-run"
+                ]
+            get_browser_fun = lambda x: x.chromium.launch(args=launch_args)
         else:
             get_browser_fun = lambda x: x.chromium.connect_over_cdp(
                 endpoint_url=data.browser_location
@@ -485,7 +978,7 @@ async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
             text = await grab_content.from_headless_browser(
                 data.url,
                 browser=browser,
-                preference=data.preference.value,
+                preference=data.preference,
                 target_language=lang,
             )
     
@@ -500,7 +993,7 @@ async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
     detected_lang = lang if lang != "auto" else grab_content.get_lang(text)
     
     # Generate timestamp and origin information
-    extraction_timestamp = datetime.now(timezone.utc).isoformat()
+    extraction_timestamp = iso_now_cached()
     extraction_origin = "realtime_crawl_fallback"  # This is a live extraction using fallback
     
     return {
@@ -509,7 +1002,7 @@ async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
         "reason": "success",
         "message": "Extraction completed using basic fallback",
         "lang": detected_lang,
-        "mode": data.method.value,
+        "mode": data.method,
         "final_url": data.url,
         "converted": False,
         "original_format": None,
@@ -522,49 +1015,35 @@ async def basic_extraction_fallback(data: ExtractionData) -> Dict[str, Any]:
     }
 
 
-async def create_fresh_browser_instance() -> tuple[async_api.Browser, Any]:
-    """Create a fresh browser instance for a single request.
+async def get_shared_browser() -> async_api.Browser:
+    """Get the shared browser instance, (re)launching it if it is missing or has crashed.
     
-    Returns tuple of (browser, playwright) for proper cleanup.
-    This approach avoids browser instance reuse issues.
+    Requests only create a fresh browser context on this browser, which is far
+    cheaper than launching Chromium per request. The lock makes sure concurrent
+    requests trigger a single relaunch.
     """
-    try:
-        from playwright.async_api import async_playwright
-        
-        # Create fresh playwright and browser instances
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--single-process',  # Helps with Docker compatibility
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding'
-            ]
-        )
-        logger.debug("Fresh browser instance created successfully")
-        return browser, playwright
-    except Exception as e:
-        logger.error(f"Failed to create fresh browser instance: {e}")
-        raise HTTPException(status_code=500, detail="Browser initialization failed")
-
-
-async def get_browser_instance() -> async_api.Browser:
-    """Get or create browser instance for browser-based extraction.
+    global browser_instance, playwright_instance
     
-    DEPRECATED: This function is kept for backward compatibility but now
-    creates fresh instances to avoid stability issues.
-    """
-    browser, _ = await create_fresh_browser_instance()
-    return browser
-
-
-
+    if browser_instance is not None and browser_instance.is_connected():
+        return browser_instance
+    
+    async with _browser_lock:
+        if browser_instance is not None and browser_instance.is_connected():
+            return browser_instance
+        
+        if browser_instance is not None:
+            logger.warning("Shared browser disconnected, relaunching")
+            try:
+                await browser_instance.close()
+            except Exception:
+                pass
+            browser_instance = None
+        
+        if playwright_instance is None:
+            playwright_instance = await async_api.async_playwright().start()
+        browser_instance = await browser_helpers.launch_browser(playwright_instance)
+        logger.info("Shared browser instance launched")
+        return browser_instance
 
 
 def main():
@@ -587,6 +1066,14 @@ def main():
         action="store_true",
         help="Enable auto-reload for development"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes, ignored with --reload (default: 1). "
+             "Each worker runs its own shared browser, process pools, result cache and "
+             "request coalescing, so MAX_CONCURRENT_* limits apply per worker."
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -597,15 +1084,27 @@ def main():
     
     args = parser.parse_args()
     
-    logger.info(f"Starting Text Extraction API - Smart v{__version__}")
-    logger.info(f"Server will be available at: http://{args.host}:{args.port}")
-    logger.info(f"API documentation: http://{args.host}:{args.port}/docs")
+    logger.info("Starting Text Extraction API - Smart v%s", __version__)
+    logger.info("Server will be available at: http://%s:%s", args.host, args.port)
+    logger.info("API documentation: http://%s:%s/docs", args.host, args.port)
+    
+    # Prefer uvloop/httptools, but fall back to uvicorn's defaults where they
+    # are not installed (uvloop is not available on Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http = "httptools" if importlib.util.find_spec("httptools") else "auto"
     
     uvicorn.run(
         "text_extraction.webservice:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else args.workers,
+        loop=loop,
+        http=http,
+        backlog=2048,
+        limit_concurrency=256,
+        timeout_keep_alive=30,
+        log_config=UVICORN_LOG_CONFIG,
         log_level=args.log_level
     )
 